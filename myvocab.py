@@ -1,6 +1,7 @@
 import logging
 import sys
 import platform
+from multiprocessing import freeze_support
 from pathlib import Path
 from dotenv import load_dotenv
 from src.myvocab.utils.logging_handler.set_stream_handler import set_stream_handler
@@ -41,6 +42,9 @@ def main(base_directory: Path, level: str):
 
 if __name__ == '__main__':
 
+    # Support the process pool in the PyInstaller executable
+    freeze_support()
+
     # The script accepts arguments in any order
     # The path argument can contain spaces
     index_d = None
@@ -7,7 +7,7 @@ block_cipher = None
 a = Analysis(['myvocab.py'],
              pathex=['C:\\wrk\\Python\\VSC\\myvocab'],
              binaries=[],
-             datas=[('.env', '.'), ('src/myvocab/parsing/infinitive/data', 'src/myvocab/parsing/infinitive/data'), ('src/myvocab/parsing/singularization/data', 'src/myvocab/parsing/singularization/data')],
+             datas=[('.env', '.'), ('src/myvocab/parsing/infinitive/data', 'src/myvocab/parsing/infinitive/data'), ('src/myvocab/parsing/singularization/data', 'src/myvocab/parsing/singularization/data'), ('src/myvocab/translation/translation_yandex/data', 'src/myvocab/translation/translation_yandex/data')],
              hiddenimports=[],
              hookspath=[],
              hooksconfig={},
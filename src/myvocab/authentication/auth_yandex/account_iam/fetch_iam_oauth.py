@@ -1,6 +1,7 @@
 import logging
 from src.myvocab.utils.fetche_handler.fetcher import fetch
 from src.myvocab.constants import constants as cns
+from src.myvocab.utils.env_handler.get_uri import get_uri
 
 logger = logging.getLogger(__name__)
 
@@ -20,4 +21,4 @@ def fetch_iam_oauth() -> dict:
     headers = {}
 
     logger.info(f"Getting an IAM token for a Yandex account.")    
-    return fetch(url=cns.URI_IAM_TOKENS, headers=headers, payload=data)
\ No newline at end of file
+    return fetch(url=get_uri('URI_IAM_TOKENS'), headers=headers, payload=data)
\ No newline at end of file
@@ -1,11 +1,10 @@
 import logging
 import os
 from pathlib import Path
-import json
 import yandexcloud
 from yandex.cloud.iam.v1.iam_token_service_pb2 import (CreateIamTokenRequest)
 from yandex.cloud.iam.v1.iam_token_service_pb2_grpc import IamTokenServiceStub
-from src.myvocab.authentication.auth_yandex.exchange_jwt_iam.create_jwt import create_jwt
+from src.myvocab.authentication.auth_yandex.exchange_jwt_iam.create_jwt import read_key, create_jwt
 from src.myvocab.exceptions import exceptions as exc
 
 logger = logging.getLogger(__name__)
@@ -13,12 +12,15 @@ logger = logging.getLogger(__name__)
 # Get an IAM token using a JWT
 # https://yandex.cloud/en/docs/iam/operations/iam-token/create-for-sa#python_2
 
+# SDK clients by the service account key ID, reused by the next calls
+_iam_services = dict()
 
-def create_iam_token() -> str:
+
+def create_iam_token() -> dict:
   """ Creating a Yandex IAM token from a service account JWT.
 
   Returns:
-    str: IAM Token
+    dict: IAM Token in the "iamToken" field and its expiry time (RFC 3339) in the "expiresAt" field
   """
 
   logger.info(f"Get an IAM token using a JWT.")
@@ -27,28 +29,20 @@ def create_iam_token() -> str:
   if not auth_key_path:
     raise exc.VariableIsNotFoundError('AUTH_KEY_PATH')
 
-  key_path = Path(auth_key_path)
-
-  # Reading a private key from a JSON file
-  with open(file=key_path, mode='r', encoding='utf-8') as f:
-    obj = f.read() 
-    obj = json.loads(obj)
-    private_key = obj['private_key']
-    key_id = obj['id']
-    service_account_id = obj['service_account_id']
-
-  sa_key = {
-    "id": key_id,
-    "service_account_id": service_account_id,
-    "private_key": private_key
-  }
-
-  jwt = create_jwt(key_path)
-  
-  sdk = yandexcloud.SDK(service_account_key=sa_key)
-  iam_service = sdk.client(IamTokenServiceStub)
+  # The key file is read once for both the JWT and the SDK
+  sa_key = read_key(Path(auth_key_path))
+
+  jwt = create_jwt(sa_key)
+
+  if (iam_service := _iam_services.get(sa_key["id"])) is None:
+    sdk = yandexcloud.SDK(service_account_key=sa_key)
+    iam_service = sdk.client(IamTokenServiceStub)
+    _iam_services[sa_key["id"]] = iam_service
   iam = iam_service.Create(
       CreateIamTokenRequest(jwt=jwt)
   )
 
-  return iam.iam_token
\ No newline at end of file
+  return {
+    "iamToken": iam.iam_token,
+    "expiresAt": iam.expires_at.ToJsonString()
+  }
\ No newline at end of file
@@ -11,24 +11,40 @@ logger = logging.getLogger(__name__)
 # https://yandex.cloud/en/docs/iam/operations/iam-token/create-for-sa#python_2
 
 
-def create_jwt(key_path: Path) -> str:
-    """ Creating a JWT for a Yandex service account.
+def read_key(key_path: Path) -> dict:
+    """ Reading a Yandex service account key.
 
     Args:
         key_path (Path): Path to the Yandex service account key JSON file
     Returns:
-        str: JSON Web Token
+        dict: The key fields "id", "service_account_id" and "private_key"
     """
 
-    logger.info(f"Generating a JWT .")
-
     # Reading a private key from a JSON file
     with open(file=key_path, mode='r', encoding='utf-8') as f:
         obj = f.read() 
         obj = json.loads(obj)
-        private_key = obj['private_key']
-        key_id = obj['id']
-        service_account_id = obj['service_account_id']
+
+    return {
+        "id": obj['id'],
+        "service_account_id": obj['service_account_id'],
+        "private_key": obj['private_key']
+    }
+
+def create_jwt(sa_key: dict) -> str:
+    """ Creating a JWT for a Yandex service account.
+
+    Args:
+        sa_key (dict): The service account key read by `read_key`
+    Returns:
+        str: JSON Web Token
+    """
+
+    logger.info(f"Generating a JWT .")
+
+    private_key = sa_key['private_key']
+    key_id = sa_key['id']
+    service_account_id = sa_key['service_account_id']
 
     now = int(time.time())
     payload = {
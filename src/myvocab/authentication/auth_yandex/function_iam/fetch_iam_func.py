@@ -1,6 +1,7 @@
 import logging
 from src.myvocab.utils.fetche_handler.fetcher import get
 from src.myvocab.constants import constants as cns
+from src.myvocab.utils.env_handler.get_uri import get_uri
 
 logger = logging.getLogger(__name__)
 
@@ -14,4 +15,4 @@ def fetch_iam_func() -> dict:
     headers = {}
 
     logger.info(f"Using function to get an IAM token for a service account.")
-    return get(url=cns.URI_FUNC_IAM_TOKENS, headers=headers)
\ No newline at end of file
+    return get(url=get_uri('URI_FUNC_IAM_TOKENS'), headers=headers)
\ No newline at end of file
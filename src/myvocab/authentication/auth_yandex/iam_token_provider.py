@@ -0,0 +1,178 @@
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from src.myvocab.constants import constants as cns
+
+logger = logging.getLogger(__name__)
+
+
+def parse_expires_at(expires_at: str) -> float | None:
+    """ Convert an RFC 3339 expiry time, e.g. '2024-02-01T12:00:00.123456789Z', to seconds since the epoch. """
+    try:
+        return datetime.fromisoformat(expires_at).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def fetch_token(auth: str | None) -> tuple:
+    """ Fetch a new IAM token with the authentication method of the `AUTH` variable.
+
+    Args:
+        auth (str | None): 'account_iam', 'exchange_jwt_iam' or, by default, 'function_iam'.
+
+    Returns:
+        tuple: The IAM token and its expiry time in seconds since the epoch, (None, None) on failure.
+    """
+
+    if auth == 'account_iam':
+        # To get an IAM token with a Yandex account
+        from src.myvocab.authentication.auth_yandex.account_iam.fetch_iam_oauth import fetch_iam_oauth
+        vdata = fetch_iam_oauth()
+        if vdata.get("ok") and (iam_token := vdata.get("iamToken")):
+            return iam_token, parse_expires_at(vdata.get("expiresAt"))
+
+    elif auth == 'exchange_jwt_iam':
+        # To get an IAM token with an Authorized keys.
+        try:
+            # Requires the optional `jwt` dependency group
+            from src.myvocab.authentication.auth_yandex.exchange_jwt_iam.create_iam_token import create_iam_token
+            vdata = create_iam_token()
+            return vdata["iamToken"], parse_expires_at(vdata.get("expiresAt"))
+        except Exception as e:
+            logger.error(f"Failed to create IAM token: {e}")
+
+    else:
+        # To get an IAM token from the function code in Yandex Cloud Functions
+        from src.myvocab.authentication.auth_yandex.function_iam.fetch_iam_func import fetch_iam_func
+        vdata = fetch_iam_func()
+        if iam_token := vdata.get("access_token"):
+            expires_in = vdata.get("expires_in")
+            return iam_token, None if not isinstance(expires_in, (int, float)) else time.time() + expires_in
+
+    return None, None
+
+
+class IamTokenProvider:
+    """ IAM token shared by all API calls of the application.
+
+    The token is cached with its expiry time in memory and, optionally, in a file readable only by the user,
+    and is fetched again shortly before it expires or when the API rejects it.
+    """
+
+    def __init__(self, auth: str | None, cache_file: Path | None = None):
+        """ Initialize the token provider.
+        Args:
+            auth (str | None): Authentication method, the `AUTH` variable of the `.env` file.
+            cache_file (Path | None): File to keep the token between runs; None keeps it in memory only.
+        """
+        self.__auth = auth
+        self.__cache_file = cache_file
+        self.__token = None
+        self.__expires_at = 0.0
+        self.__lock = threading.Lock()
+
+    @property
+    def auth(self):
+        """ Get the authentication method. """
+        return self.__auth
+
+    @property
+    def cache_file(self):
+        """ Get the file to keep the token between runs. """
+        return self.__cache_file
+
+    @cache_file.setter
+    def cache_file(self, cache_file: Path | None):
+        """ Set the file to keep the token between runs; a token fetched before is saved to it. """
+        with self.__lock:
+            self.__cache_file = cache_file
+            if self.__is_valid():
+                self.__save()
+
+    def get_token(self, rejected_token: str = None) -> str | None:
+        """ Get a valid IAM token, fetching a new one only when needed.
+
+        Args:
+            rejected_token (str): The token the API answered 401 to. It is replaced unless another call already did that.
+
+        Returns:
+            str | None: The IAM token, None if it cannot be fetched.
+        """
+        with self.__lock:
+            if rejected_token is not None and rejected_token == self.__token:
+                logger.info("The IAM token is rejected, fetching a new one.")
+                self.__token = None
+                self.__expires_at = 0.0
+                self.__remove()
+            elif self.__token is None:
+                self.__load()
+
+            if self.__is_valid():
+                return self.__token
+
+            iam_token, expires_at = fetch_token(self.__auth)
+            if not iam_token:
+                return None
+            self.__token = iam_token
+            # A token without a known expiry time is kept for the recommended refresh period
+            self.__expires_at = expires_at if expires_at is not None else time.time() + cns.IAM_TOKEN_LIFETIME
+            self.__save()
+            return self.__token
+
+    def __is_valid(self) -> bool:
+        """ Check whether the cached token is not about to expire. """
+        return self.__token is not None and time.time() < self.__expires_at - cns.IAM_TOKEN_REFRESH_MARGIN
+
+    def __load(self) -> None:
+        """ Read the token of the same authentication method from the cache file. """
+        if self.__cache_file is None or not self.__cache_file.is_file():
+            return
+        try:
+            data = json.loads(self.__cache_file.read_text(encoding='utf-8'))
+            if data.get("auth") == self.__auth and data.get("token") and isinstance(data.get("expires_at"), (int, float)):
+                self.__token = data["token"]
+                self.__expires_at = float(data["expires_at"])
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Failed to read file: {self.__cache_file}: {type(e)} {e}")
+
+    def __save(self) -> None:
+        """ Write the token to the cache file, readable and writable only by the user. """
+        if self.__cache_file is None:
+            return
+        data = {"auth": self.__auth, "token": self.__token, "expires_at": self.__expires_at}
+        temp_file = self.__cache_file.with_name(self.__cache_file.name + ".tmp")
+        try:
+            self.__cache_file.parent.mkdir(exist_ok = True, parents = True)
+            descriptor = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(descriptor, "w", encoding='utf-8') as f:
+                json.dump(data, f)
+            temp_file.replace(self.__cache_file)
+        except Exception as e:
+            logger.exception(f"Failed to write file: {self.__cache_file}: {type(e)} {e}")
+
+    def __remove(self) -> None:
+        """ Delete the cache file with a rejected token. """
+        if self.__cache_file is not None:
+            self.__cache_file.unlink(missing_ok=True)
+
+
+# The provider shared by all callers, created on the first call
+_provider = None
+_provider_lock = threading.Lock()
+
+def get_token_provider() -> IamTokenProvider:
+    """ Get the IAM token provider shared by all callers.
+
+    Returns:
+        IamTokenProvider: The token provider for the `AUTH` variable of the `.env` file.
+    """
+    global _provider
+    with _provider_lock:
+        auth = os.getenv('AUTH')
+        if _provider is None or _provider.auth != auth:
+            _provider = IamTokenProvider(auth)
+        return _provider
@@ -8,17 +8,34 @@ UNCHANGED_DATA_ID = -1000
 RANGE_SINGULAR_ID = range(1, 1000)
 RANGE_INFINIT_ID = range(1000, 2000)
 
+# PARSING
+# Version of the parsing rules; cached parsing results of other versions are discarded
+PARSER_VERSION = 4
+# Number of characters read from a text file at once
+READ_CHUNK_SIZE = 1024 * 1024
+# Maximum number of unique lines kept in memory when sorting the vocabulary
+SORT_MEMORY_BUDGET = 1_000_000
+# Version of the compiled reference lists format; snapshots of other versions are rebuilt
+REFERENCE_SNAPSHOT_VERSION = 2
+
+# TOKENS
+# Token types of the text enclosed in <<word>> and <</word>> tag-only strings
+TOKEN_WORD = 0
+TOKEN_NUMBER = 1
+TOKEN_COMPOUND = 2
+
 # MARKS
 # Tags for controlling text parsing
 TAG_WORD = '<<word>>'
 TAG_END_WORD = '<</word>>'
-TAG_TRANSLATE = '<<tr>>'
 
 # WORD TRANSLATION
 # Target chunk size (Yandex Translate API has a 10_000 character limit per request)
 TRANSLATE_CHUNK_SIZE = 10_000
 # Folder for sent and received translation chunks
 TRANSLATE_FOLDER = 'Translate'
+# Checkpoint of a translated chunk in the `Translate` folder, named by the target language code and a hash of the chunk
+TRANSLATE_CHECKPOINT_FILE = 'checkpoint_{}_{}.json'
 
 # FETCHING YANDEX API
 # Endpoint to invoke the public function
@@ -29,5 +46,21 @@ URI_IAM_TOKENS = 'https://iam.api.cloud.yandex.net/iam/v1/tokens'
 URI_TRANSLATE = 'https://translate.api.cloud.yandex.net/translate/v2/translate'
 # Endpoint for get supported languages
 URI_LANGUAGES = 'https://translate.api.cloud.yandex.net/translate/v2/languages'
+# IAM token is fetched again this number of seconds before it expires
+IAM_TOKEN_REFRESH_MARGIN = 300
+# Lifetime in seconds of an IAM token without a known expiry time (Yandex recommends refreshing IAM tokens every hour)
+IAM_TOKEN_LIFETIME = 3600
 # Service account folder ID
 FOLDER_ID = "b1gq1oofuk6esi44suvt"
+# Timeouts of a request in seconds: (connect, read)
+FETCH_TIMEOUT = (5, 30)
+# Number of retries of a failed request
+FETCH_RETRIES = 3
+# Exponential backoff between retries in seconds: factor * 2 ** (retry - 1)
+FETCH_BACKOFF_FACTOR = 0.5
+# Response status codes that are retried (`Retry-After` is respected for 429 and 503)
+FETCH_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Maximum wait in seconds before a retry; a longer `Retry-After` is cut to it
+FETCH_RETRY_AFTER_MAX = 30
+# Maximum number of kept-alive connections per host
+FETCH_POOL_SIZE = 16
@@ -81,6 +81,29 @@ class NonBooleanValueError(VocabError):
     def __str__(self) -> str:
         return f"{self.message} '{self.directory}'"
 
+class NonIntegerValueError(VocabError):
+    """ Raised when a value is not of type integer. """
+    def __init__(self, directory, message="The value is not of type integer:"):
+        self.directory = directory
+        self.message = message   
+        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return f"{self.message} '{self.directory}'"
+
+class IntegerBelowMinimumError(VocabError):
+    """ Raised when an integer setting is below its minimum value. """
+    def __init__(self, value, min_value: int, name: str = None, message: str = "The value is below the minimum"):
+        self.value = value
+        self.min_value = min_value
+        self.name = name
+        self.message = message
+        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        setting = "" if self.name is None else f" of '{self.name}'"
+        return f"{self.message}{setting} ({self.min_value}): '{self.value}'"
+
 class IndexOutOfRangeError(VocabError):
     """ Raised when an index out of range. """
     def __init__(self, directory, message="The index out of range:"):
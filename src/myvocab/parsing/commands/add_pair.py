@@ -0,0 +1,15 @@
+from src.myvocab.constants import constants as cns
+
+def add_pair(payload: dict, pairs: dict) -> None:
+    """ Store the word pair based on the transformer ID.
+
+    Args:
+        payload (dict): Processed data with 'id', 'word', and 'pair' fields.
+        pairs (dict): Sets of 'singular' and 'infinit' pairs.
+    """
+
+    if payload["pair"] != "":
+        if payload["id"] in cns.RANGE_SINGULAR_ID:
+            pairs["singular"].add(payload["pair"])
+        elif payload["id"] in cns.RANGE_INFINIT_ID:
+            pairs["infinit"].add(payload["pair"])
@@ -0,0 +1,58 @@
+from collections.abc import Iterator
+from pathlib import Path
+from src.myvocab.constants import constants as cns
+from src.myvocab.exceptions import exceptions as exc
+from src.myvocab.parsing.commands.read_file_lines import read_file_lines
+from src.myvocab.utils.sort_handler.external_sort import ExternalSort
+
+def diff_sorted_files(base_path: Path, compared_path: Path, temp_directory: Path,
+                      counts: dict = None, memory_budget: int = cns.SORT_MEMORY_BUDGET) -> Iterator[str]:
+    """ Get the difference between two files of any size.
+
+    Both files are read lazily and sorted within the memory budget (see `ExternalSort`),
+    then the sorted unique lines are merged in a single pass.
+
+    Args:
+        base_path (Path): Base file path
+        compared_path (Path): Compared file path
+        temp_directory (Path): Directory for temporary files with sorted runs
+        counts (dict, optional): Receives the number of lines found only in the base file ('added')
+            and only in the compared file ('removed') when the iteration is finished.
+        memory_budget (int, optional): Maximum number of lines of each file kept in memory.
+            Defaults to `cns.SORT_MEMORY_BUDGET`.
+    Yields:
+        str: Different lines in sorted order.
+    """
+
+    for file_path in (base_path, compared_path):
+        if not file_path.exists():
+            raise exc.DirectoryNotExistError(file_path.resolve())
+        if file_path.is_dir():
+            raise exc.DirectoryIsNotFileError(file_path.resolve())
+
+    added = 0
+    removed = 0
+    with (ExternalSort(temp_directory, memory_budget) as base_sort,
+          ExternalSort(temp_directory, memory_budget) as compared_sort):
+        base_sort.update(read_file_lines(base_path))
+        compared_sort.update(read_file_lines(compared_path))
+
+        compared_lines = iter(compared_sort)
+        compared = next(compared_lines, None)
+        for base in base_sort:
+            # Skip the compared lines that are missing from the base file
+            while compared is not None and compared < base:
+                removed += 1
+                compared = next(compared_lines, None)
+            if compared == base:
+                compared = next(compared_lines, None)
+            else:
+                added += 1
+                yield base
+        while compared is not None:
+            removed += 1
+            compared = next(compared_lines, None)
+
+    if counts is not None:
+        counts["added"] = added
+        counts["removed"] = removed
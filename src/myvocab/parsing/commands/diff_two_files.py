@@ -1,25 +1,24 @@
 from pathlib import Path
 from src.myvocab.parsing.commands.get_file_unique_lines import get_file_unique_lines
 
-def diff_two_files(base_path: Path, compared_path: Path) -> list:
+def diff_two_files(base_path: Path, compared_path: Path, counts: dict = None) -> list:
     """ Get the difference between two files.
 
+    Both files are loaded as sets of unique lines, so the difference takes linear time.
+
     Args:
         base_path (Path): Base file path
         compared_path (Path): Compared file path
+        counts (dict, optional): Receives the number of lines found only in the base file ('added')
+            and only in the compared file ('removed').
     Returns:
         list: Different lines
     """
 
     base_file = get_file_unique_lines(base_path)
     compared_file = get_file_unique_lines(compared_path)
-    differ_lines = set()
-    for base in base_file:
-        is_no_checked = True
-        for compare in compared_file:
-            if base == compare:
-                is_no_checked = False
-                break
-        if is_no_checked:
-            differ_lines.add(base)
-    return list(differ_lines)
\ No newline at end of file
+    differ_lines = base_file - compared_file
+    if counts is not None:
+        counts["added"] = len(differ_lines)
+        counts["removed"] = len(compared_file - base_file)
+    return list(differ_lines)
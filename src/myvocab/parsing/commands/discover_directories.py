@@ -0,0 +1,71 @@
+import os
+from pathlib import Path
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+from src.myvocab.utils.walk_handler.handle_error import handle_error
+from src.myvocab.utils.walk_handler.scan_walk import scan_walk
+
+def discover_directories(vocab: vcb.VocabConfig) -> list:
+    """ Find the directories and text files to parse.
+
+    The directory tree is traversed once, starting from the base directory.
+    Directories prefixed with '!' (if 'use_folder_with_leading_exclamation_mark' flag is unset)
+    and the resulting directories are pruned before they are listed.
+    The result is shared by the directory tree renderer and the file parser.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+    Returns:
+        list: Tuples of the included directory path, its path starting from the base directory,
+            and the names of its included text files.
+    """
+
+    use_mark = vocab.use_folder_with_leading_exclamation_mark
+    dir_unique_id = vocab.dir_unique_id
+
+    def is_excluded(name: str) -> bool:
+        """ Check if a directory should be ignored by its name. """
+        # Ignore directories prefixed with '!' if 'use_folder_with_leading_exclamation_mark' flag is unset
+        if not use_mark and name.startswith('!'):
+            return True
+        # Exclude the resulting directories from parsing
+        return dir_unique_id in name
+
+    def skip_dir(entry: os.DirEntry) -> bool:
+        """ Check if a directory entry should be ignored. """
+        return is_excluded(entry.name)
+
+    directories = list()
+
+    offset = len(vocab.base_directory.parts) - 1
+    # If the PyInstaller executable sets the base directory to '.'
+    if offset < 0:
+        offset = 0
+
+    base_parts = Path(*vocab.base_directory.parts[offset::])
+    # The base directory itself should be ignored
+    if is_excluded(base_parts.name):
+        return directories
+
+    # Paths starting from the base directory
+    parts_map = {vocab.base_directory: base_parts}
+
+    for dirpath, dirs, files in scan_walk(vocab.base_directory, skip_dir, handle_error):
+
+        # The path is starting from the base directory.
+        dirpath_parts = parts_map.pop(dirpath)
+        for dirname in dirs:
+            parts_map[Path.joinpath(dirpath, dirname)] = Path.joinpath(dirpath_parts, dirname)
+
+        filenames = list()
+        for filename in files:
+            # Text files only
+            if not filename.endswith(".txt"):
+                continue
+            # Ignore files prefixed with '!' if 'use_folder_with_leading_exclamation_mark' flag is unset
+            if not use_mark and filename.startswith('!'):
+                continue
+            filenames.append(filename)
+
+        directories.append((dirpath, dirpath_parts, filenames))
+
+    return directories
@@ -0,0 +1,18 @@
+import hashlib
+from pathlib import Path
+
+def get_file_hash(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """ Get the content hash of a file.
+
+    Args:
+        file_path (Path): File path
+        chunk_size (int, optional): Size of the read buffer. Defaults to 1 MiB.
+    Returns:
+        str: Hexadecimal BLAKE2b digest of the file content.
+    """
+
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
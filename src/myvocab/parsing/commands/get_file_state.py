@@ -0,0 +1,22 @@
+from pathlib import Path
+from src.myvocab.parsing.commands.get_file_hash import get_file_hash
+
+def get_file_state(file_path: Path, entry: dict = None) -> dict:
+    """ Get the size, modification time and content hash of a file.
+
+    The content hash is taken from the manifest entry if the size and modification time are unchanged.
+
+    Args:
+        file_path (Path): File path
+        entry (dict, optional): Manifest entry of the previous run. Defaults to None.
+    Returns:
+        dict: File state with 'size', 'mtime_ns' and 'hash' fields.
+    """
+
+    stat = file_path.stat()
+    if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+        file_hash = entry.get("hash")
+    else:
+        file_hash = get_file_hash(file_path)
+
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": file_hash}
@@ -1,49 +1,104 @@
 import logging
 import re
 from src.myvocab.parsing.vocabulary import vocabulary as vcb
+from src.myvocab.parsing.infinitive import infinitive as inf
 from src.myvocab.constants import constants as cns
 from src.myvocab.exceptions import exceptions as exc
 from src.myvocab.parsing.commands.get_init_data import get_init_data
 
 logger = logging.getLogger(__name__)
 
-def get_infinit(word: str, vocab: vcb.VocabConfig) -> dict:
-    """ Convert  a verb to its infinitive form.
+VOWELS = frozenset('aeiouy')
 
-    Args:
-        word (str): The input word may be modified
-        vocab (VocabConfig): 'Vocabulary configuration' object
-    Returns:
-        dict: Processed data
+def _pair_data(rule_id: int, cur_word: str, val: str) -> dict:
+    """ Get processed data with the word transformation pair. """
+    return {"id": rule_id, "word": val, "pair": "" if cur_word == val else f"{cur_word} - {val}"}
+
+def _dispatch_ending_ed(cur_word: str, attrib: inf.InfinitAttrib) -> dict:
+    """ Convert an alphanumeric verb ending in -ed to its infinitive form by its suffix. """
+
+    length = len(cur_word)
+    # It requires a verb ending in '-ed'
+    if length < 3 or cur_word[-2:] != 'ed':
+        return get_init_data(cur_word)
+
+    # Searching for a verb ending in '-e' in the set
+    val = cur_word[:-1]
+    if val in attrib.verbs_ending_e:
+        return _pair_data(1050, cur_word, val)
+    # Searching for a verb not ending in '-ed' in the set
+    val = cur_word[:-2]
+    if val in attrib.verbs_ending_non_ed:
+        return _pair_data(1060, cur_word, val)
+
+    before_ed = cur_word[-3]
+    # It requires a verb ending in '2 consonants + ed'
+    if length >= 5 and before_ed == cur_word[-4] and before_ed not in VOWELS:
+        # removes the '-ed' ending and reduce any double consonants
+        return _pair_data(1070, cur_word, cur_word[:-3])
+    # It requires a verb ending in 'consonant + -ied'
+    if before_ed == 'i' and length >= 5 and cur_word[-4] not in VOWELS:
+        # removes the '-ed' ending and replaces 'i' with 'y'
+        return _pair_data(1080, cur_word, cur_word[:-3] + "y")
+    # It requires a verb ending in '-xed'
+    if before_ed == 'x' and length >= 4:
+        # removes the '-ed' ending
+        return _pair_data(1090, cur_word, cur_word[:-2])
+    # It requires a verb ending in '-icked'
+    if before_ed == 'k' and length >= 6 and cur_word[-5:-3] == 'ic':
+        # removes the '-ked' ending
+        return _pair_data(1100, cur_word, cur_word[:-3])
+    # removes the '-ed' ending
+    return _pair_data(1110, cur_word, val)
+
+def _dispatch_infinit(cur_word: str, attrib: inf.InfinitAttrib) -> dict:
+    """ Convert an alphanumeric verb to its infinitive form. """
+
+    # It requires an irregular verb in the V3 form
+    if verb := attrib.verbs_v3.get(cur_word):
+        return _pair_data(1010, cur_word, verb)
+    # It requires an irregular verb in the V2 form
+    if verb := attrib.verbs_v2.get(cur_word):
+        return _pair_data(1020, cur_word, verb)
+    # It requires an irregular verb in the V1 form
+    if verb := attrib.verbs_v1.get(cur_word):
+        return {"id": 1030, "word": verb, "pair": ""}
+    # It requires a word ending in -ed
+    if cur_word in attrib.only_ending_ed:
+        return {"id": 1040, "word": cur_word, "pair": ""}
+    return _dispatch_ending_ed(cur_word, attrib)
+
+def _match_infinit(cur_word: str, attrib: inf.InfinitAttrib) -> dict:
+    """ Convert a verb to its infinitive form with the regular expression cascade.
+
+    It is the reference implementation of the rules, used for words that are not alphanumeric.
     """
 
-    cur_range = cns.RANGE_INFINIT_ID
-    cur_word = word.lower().strip()
     cur_data = get_init_data(cur_word)
 
     # It requires an irregular verb in the V3 form
-    if verb := vocab.infinit.verbs_v3.get(cur_word):
+    if verb := attrib.verbs_v3.get(cur_word):
         cur_data = {
                 "id": 1010,
                 "word": verb,
                 "pair": "" if cur_word == verb else f"{cur_word} - {verb}"
             }
     # It requires an irregular verb in the V2 form
-    elif verb := vocab.infinit.verbs_v2.get(cur_word):
+    elif verb := attrib.verbs_v2.get(cur_word):
         cur_data = {
                 "id": 1020,
                 "word": verb,
                 "pair": "" if cur_word == verb else f"{cur_word} - {verb}"
             }
     # It requires an irregular verb in the V1 form
-    elif verb := vocab.infinit.verbs_v1.get(cur_word):
+    elif verb := attrib.verbs_v1.get(cur_word):
         cur_data = {
                 "id": 1030,
                 "word": verb,
                 "pair": ""
             }
     # It requires a word ending in -ed
-    elif cur_word in vocab.infinit.only_ending_ed:
+    elif cur_word in attrib.only_ending_ed:
         cur_data = {
             "id": 1040,
             "word": cur_word,
@@ -53,7 +108,7 @@ def get_infinit(word: str, vocab: vcb.VocabConfig) -> dict:
     # It requires a verb ending in '-ed'
     elif verb_e_d := re.findall(r'((.+)e)d\b', cur_word):
         # Searching for a verb ending in '-e' in the set
-        if verb_e_d[0][0] in vocab.infinit.verbs_ending_e:
+        if verb_e_d[0][0] in attrib.verbs_ending_e:
             val = verb_e_d[0][0]
             cur_data = {
                 "id": 1050,
@@ -61,7 +116,7 @@ def get_infinit(word: str, vocab: vcb.VocabConfig) -> dict:
                 "pair": "" if cur_word == val else f"{cur_word} - {val}"
             }
         # Searching for a verb not ending in '-ed' in the set
-        elif verb_e_d[0][1] in vocab.infinit.verbs_ending_non_ed:
+        elif verb_e_d[0][1] in attrib.verbs_ending_non_ed:
             val = verb_e_d[0][1]
             cur_data = {
                 "id": 1060,
@@ -130,6 +185,29 @@ def get_infinit(word: str, vocab: vcb.VocabConfig) -> dict:
                     "pair": "" if cur_word == val else f"{cur_word} - {val}"
                 }
 
+    return cur_data
+
+def get_infinit(word: str, vocab: vcb.VocabConfig) -> dict:
+    """ Convert  a verb to its infinitive form.
+
+    Alphanumeric words are dispatched on their suffix to the only rules that can match them.
+    Other words go through the regular expression cascade. Both give the same results.
+
+    Args:
+        word (str): The input word may be modified
+        vocab (VocabConfig): 'Vocabulary configuration' object
+    Returns:
+        dict: Processed data
+    """
+
+    cur_range = cns.RANGE_INFINIT_ID
+    cur_word = word.lower().strip()
+
+    if cur_word.isascii() and cur_word.isalnum():
+        cur_data = _dispatch_infinit(cur_word, vocab.infinit)
+    else:
+        cur_data = _match_infinit(cur_word, vocab.infinit)
+
     # If data has changed
     if cur_data['id'] != cns.UNCHANGED_DATA_ID:
         # Log the word transformation pair
@@ -0,0 +1,50 @@
+import hashlib
+from pathlib import Path
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+from src.myvocab.parsing.infinitive.data import path_file
+from src.myvocab.constants import constants as cns
+
+def get_reference_paths(vocab: vcb.VocabConfig) -> list:
+    """ Get the reference word lists used by the enabled transformers.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+    Returns:
+        list: Paths of the reference word lists.
+    """
+
+    paths = list()
+    if vocab.use_lemma_singular:
+        # Irregular verbs ending in -s from the internal project data
+        paths.append(Path.joinpath(Path(path_file.__file__).parent, "irregular_verbs.txt"))
+        paths.append(vocab.singular.only_ending_s_path)
+        paths.append(vocab.singular.singular_ending_non_s_path)
+        paths.append(vocab.singular.irregular_plural_nouns_path)
+        paths.append(vocab.singular.reviewed_pairs_path)
+    if vocab.use_lemma_infinit:
+        paths.append(vocab.infinit.irregular_verbs_path)
+        paths.append(vocab.infinit.only_ending_ed_path)
+        paths.append(vocab.infinit.verbs_ending_e_path)
+        paths.append(vocab.infinit.verbs_ending_non_ed_path)
+        paths.append(vocab.infinit.reviewed_pairs_path)
+    return paths
+
+def get_reference_fingerprint(vocab: vcb.VocabConfig) -> str:
+    """ Get the fingerprint of the parsing rules.
+
+    The fingerprint changes when the parser version, the transformer flags,
+    or the content of any reference word list changes.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+    Returns:
+        str: Hexadecimal BLAKE2b digest.
+    """
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{cns.PARSER_VERSION}|{vocab.use_lemma_singular}|{vocab.use_lemma_infinit}".encode())
+    for path in get_reference_paths(vocab):
+        hasher.update(str(path.name).encode())
+        if path.is_file():
+            hasher.update(path.read_bytes())
+    return hasher.hexdigest()
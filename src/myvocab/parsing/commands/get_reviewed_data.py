@@ -0,0 +1,28 @@
+import logging
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+
+logger = logging.getLogger(__name__)
+
+def get_reviewed_data(word: str, vocab: vcb.VocabConfig) -> dict | None:
+    """ Get the reviewed transformation of a word.
+
+    The reviewed pairs of the enabled transformers are searched in the order the transformers are applied.
+
+    Args:
+        word (str): The input word
+        vocab (VocabConfig): 'Vocabulary configuration' object
+    Returns:
+        dict | None: Processed data, or None if the word has not been reviewed.
+    """
+
+    # Reviewed singular pairs
+    if vocab.use_lemma_singular and (lemma := vocab.singular.reviewed_pairs.get(word)) is not None:
+        rule_id = 5
+    # Reviewed infinitive pairs
+    elif vocab.use_lemma_infinit and (lemma := vocab.infinit.reviewed_pairs.get(word)) is not None:
+        rule_id = 1005
+    else:
+        return None
+
+    logger.debug(f"(id={rule_id}) {word} -> {lemma}")
+    return {"id": rule_id, "word": lemma, "pair": "" if word == lemma else f"{word} - {lemma}"}
@@ -0,0 +1,35 @@
+import logging
+from pathlib import Path
+from src.myvocab.exceptions import exceptions as exc
+from src.myvocab.parsing.commands.read_file_lines import read_file_lines
+
+logger = logging.getLogger(__name__)
+
+def get_reviewed_pairs(file_path: Path) -> dict:
+    """ Get a map of reviewed word transformations.
+
+    Each line of `file_path` is a word pair in the 'word - lemma' form, as written to `parsed_pairs.txt`.
+    Lines in any other form are ignored. The file is read in line order, so if a word has several reviewed forms,
+    the last one is used in every run and every worker process.
+
+    Args:
+        file_path (Path): Reviewed pairs file path
+    Returns:
+        dict: Map with original words as keys and their reviewed forms as values.
+    """
+
+    if not file_path.exists():
+        raise exc.DirectoryNotExistError(file_path.resolve())
+    if file_path.is_dir():
+        raise exc.DirectoryIsNotFileError(file_path.resolve())
+
+    pairs = dict()
+    for line in read_file_lines(file_path):
+        word, separator, lemma = line.partition(" - ")
+        word = word.strip()
+        lemma = lemma.strip()
+        if separator and word != "" and lemma != "":
+            if (previous := pairs.get(word)) is not None and previous != lemma:
+                logger.warning(f"Conflicting reviewed pairs in {file_path}: `{word} - {previous}` is replaced with `{word} - {lemma}`")
+            pairs[word] = lemma
+    return pairs
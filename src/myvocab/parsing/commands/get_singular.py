@@ -1,29 +1,145 @@
 import logging
 import re
 from src.myvocab.parsing.vocabulary import vocabulary as vcb
+from src.myvocab.parsing.singularization import singularization as sng
 from src.myvocab.constants import constants as cns
 from src.myvocab.exceptions import exceptions as exc
 from src.myvocab.parsing.commands.get_init_data import get_init_data
 
 logger = logging.getLogger(__name__)
 
-# Singularize a word
-def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
-    """ Convert a word to its singular form.
+VOWELS = frozenset('aeiouy')
 
-    Args:
-        word (str): The input word may be modified
-        vocab (VocabConfig): 'Vocabulary configuration' object
-    Returns:
-        dict: Processed data
+def _pair_data(rule_id: int, cur_word: str, val: str) -> dict:
+    """ Get processed data with the word transformation pair. """
+    return {"id": rule_id, "word": val, "pair": cur_word + " - " + val}
+
+def _rule_ending_es(cur_word: str, attrib: sng.SingularAttrib) -> dict:
+    """ Rules for words ending in -es: -ves, consonant + -oes, consonant + -ies, s|x|z|ch|sh + -es. """
+
+    length = len(cur_word)
+    # It requires a word ending in -ves
+    if length >= 4 and cur_word[-3] == 'v':
+        val = cur_word[:-3]
+        # Replace '-ves' with '-fe' and look up in the set
+        if val + 'fe' in attrib.singular_ending_non_s:
+            return _pair_data(50, cur_word, val + 'fe')
+        # Replace '-ves' with '-f' and look up in the set
+        if val + 'f' in attrib.singular_ending_non_s:
+            return _pair_data(60, cur_word, val + 'f')
+        # Replace '-ves' with '-f'
+        return _pair_data(70, cur_word, val + 'f')
+
+    # It requires a word ending in 'consonant + o + es'
+    if length >= 5 and cur_word[-3] == 'o' and cur_word[-4] not in VOWELS:
+        val = cur_word[:-2]
+        # Removes '-es' and look up in the set
+        return _pair_data(80 if val in attrib.singular_ending_non_s else 90, cur_word, val)
+
+    # It requires a word ending in 'consonant + ies'
+    if length >= 5 and cur_word[-3] == 'i' and cur_word[-4] not in VOWELS:
+        val = cur_word[:-3]
+        # Replace '-ies' with '-y' (the set is looked up without '-y')
+        return _pair_data(100 if val in attrib.singular_ending_non_s else 110, cur_word, val + 'y')
+
+    # It requires a word ending in 's|ss|ch|sh|x|z + es'
+    if length >= 4 and cur_word[-3] in 'sxz':
+        ending = cur_word[-3]
+    elif length >= 5 and cur_word[-4:-2] in ('ch', 'sh'):
+        ending = cur_word[-4:-2]
+    else:
+        # Removes '-s'
+        return _pair_data(180, cur_word, cur_word[:-1])
+
+    val = cur_word[:-2]
+    # It requires a word ending in 's|ss + es'
+    # Removes '-es' and look up in the set
+    if ending == 's' and val in attrib.only_ending_s:
+        return _pair_data(140, cur_word, val)
+    # It requires a word ending in 'ch|sh|x|z + es'
+    # Removes '-es' and look up in the set
+    if ending != 's' and val in attrib.singular_ending_non_s:
+        return _pair_data(150, cur_word, val)
+    # Removes '-es'
+    return _pair_data(160, cur_word, val)
+
+def _rule_ending_os(cur_word: str, attrib: sng.SingularAttrib) -> dict:
+    """ Rules for words ending in consonant + -os. """
+
+    if len(cur_word) >= 4 and cur_word[-3] not in VOWELS:
+        val = cur_word[:-1]
+        # Removes '-s' and look up in the set
+        return _pair_data(80 if val in attrib.singular_ending_non_s else 90, cur_word, val)
+    # Removes '-s'
+    return _pair_data(180, cur_word, cur_word[:-1])
+
+def _rule_ending_ys(cur_word: str, attrib: sng.SingularAttrib) -> dict:
+    """ Rules for words ending in vowel + -ys. """
+
+    if len(cur_word) >= 4 and cur_word[-3] in VOWELS:
+        val = cur_word[:-1]
+        # Removes '-s' and look up in the set
+        return _pair_data(120 if val in attrib.singular_ending_non_s else 130, cur_word, val)
+    # Removes '-s'
+    return _pair_data(180, cur_word, cur_word[:-1])
+
+def _rule_ending_digit_s(cur_word: str, attrib: sng.SingularAttrib) -> dict:
+    """ Rules for alphanumeric strings ending in digit + -s (like '1980s'). """
+
+    if len(cur_word) >= 3:
+        return {"id": 170, "word": cur_word, "pair": ""}
+    # Removes '-s'
+    return _pair_data(180, cur_word, cur_word[:-1])
+
+# Rules dispatched on the last two characters of a word ending in -s
+SUFFIX_RULES = {
+    'es': _rule_ending_es,
+    'os': _rule_ending_os,
+    'ys': _rule_ending_ys,
+} | {f'{digit}s': _rule_ending_digit_s for digit in '0123456789'}
+
+def _dispatch_singular(cur_word: str, attrib: sng.SingularAttrib) -> dict:
+    """ Convert an alphanumeric word to its singular form by its suffix. """
+
+    # It requires an irregular plural noun (e.g., feet)
+    if val := attrib.irregular_plural_nouns.get(cur_word):
+        return {
+            "id": 10,
+            "word": val, # (e.g., foot)
+            "pair": "" if cur_word == val else f"{cur_word} - {val}"
+        }
+
+    # It requires a word ending in -s
+    if len(cur_word) < 2 or cur_word[-1] != 's':
+        return get_init_data(cur_word)
+
+    # Searching for a word  with invariable '-s' endings in the set
+    if cur_word in attrib.only_ending_s:
+        return {"id": 20, "word": cur_word, "pair": ""}
+
+    val = cur_word[:-1]
+    # Skip further processing for words whose base form does not end in '-s' if they are present in the set.
+    if val in attrib.singular_ending_non_s:
+        return _pair_data(30, cur_word, val)
+    # Skip further processing for words whose base form does not end in '-es' if they are present in the set.
+    if val[-1:] == 'e' and val[:-1] in attrib.singular_ending_non_s:
+        return _pair_data(40, cur_word, val[:-1])
+
+    if rule := SUFFIX_RULES.get(cur_word[-2:]):
+        return rule(cur_word, attrib)
+    # Removes '-s'
+    return _pair_data(180, cur_word, val)
+
+def _match_singular(cur_word: str, attrib: sng.SingularAttrib) -> dict:
+    """ Convert a word to its singular form with the regular expression cascade.
+
+    It is the reference implementation of the rules, used for words that are not alphanumeric.
     """
 
-    cur_range = cns.RANGE_SINGULAR_ID
-    cur_word = word.lower().strip()
     cur_data = get_init_data(cur_word)
 
     # It requires an irregular plural noun (e.g., feet)
-    if val := vocab.singular.irregular_plural_nouns.get(cur_word):
+    if val := attrib.irregular_plural_nouns.get(cur_word):
         cur_data = {
             "id": 10, 
             "word": val, # (e.g., foot)
@@ -33,14 +149,14 @@ def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
     elif word_s := re.findall(r'(.+)s\b', cur_word):
 
         # Searching for a word  with invariable '-s' endings in the set
-        if cur_word in vocab.singular.only_ending_s:
+        if cur_word in attrib.only_ending_s:
             cur_data = {
                 "id": 20,
                 "word": cur_word,
                 "pair": ""
             }
         # Skip further processing for words whose base form does not end in '-s' if they are present in the set.
-        elif word_s[0] in vocab.singular.singular_ending_non_s:
+        elif word_s[0] in attrib.singular_ending_non_s:
             val = word_s[0]
             cur_data = {
                 "id": 30,
@@ -48,7 +164,7 @@ def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
                 "pair": cur_word + " - " + val
             }
         # Skip further processing for words whose base form does not end in '-es' if they are present in the set.
-        elif word_s[0][-1:] == 'e' and word_s[0][:-1] in vocab.singular.singular_ending_non_s:
+        elif word_s[0][-1:] == 'e' and word_s[0][:-1] in attrib.singular_ending_non_s:
             val = word_s[0][:-1]
             cur_data = {
                 "id": 40,
@@ -75,7 +191,7 @@ def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
                                 word_09 = re.findall(r'.+[0-9]+s\b', cur_word)
 
             # Replace '-ves' with '-fe' and look up in the set
-            if word_ves and word_ves[0] + 'fe' in vocab.singular.singular_ending_non_s:
+            if word_ves and word_ves[0] + 'fe' in attrib.singular_ending_non_s:
                 val = word_ves[0] + 'fe'
                 cur_data = {
                     "id": 50,
@@ -83,7 +199,7 @@ def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
                     "pair": cur_word + " - " + val
                 }
             # Replace '-ves' with '-f' and look up in the set
-            elif word_ves and word_ves[0] + 'f' in vocab.singular.singular_ending_non_s:
+            elif word_ves and word_ves[0] + 'f' in attrib.singular_ending_non_s:
                 val = word_ves[0] + 'f'
                 cur_data = {
                     "id": 60,
@@ -99,7 +215,7 @@ def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
                     "pair": cur_word + " - " + val
                 }
             # Removes '-es|s' and look up in the set
-            elif word_o_es_s and word_o_es_s[0][0] in vocab.singular.singular_ending_non_s:
+            elif word_o_es_s and word_o_es_s[0][0] in attrib.singular_ending_non_s:
                 val = word_o_es_s[0][0]
                 cur_data = {
                     "id": 80,
@@ -115,7 +231,7 @@ def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
                     "pair": cur_word + " - " + val
                 }
             # Replace '-ies' with '-y' and look up in the set
-            elif word_ies and word_ies[0] in vocab.singular.singular_ending_non_s:
+            elif word_ies and word_ies[0] in attrib.singular_ending_non_s:
                 val = word_ies[0] + 'y'
                 cur_data = {
                     "id": 100,
@@ -131,7 +247,7 @@ def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
                     "pair": cur_word + " - " + val
                 }
             # Removes '-s' and look up in the set
-            elif word_ys and word_ys[0] in vocab.singular.singular_ending_non_s:
+            elif word_ys and word_ys[0] in attrib.singular_ending_non_s:
                 val = word_ys[0]
                 cur_data = {
                     "id": 120,
@@ -148,7 +264,7 @@ def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
                 }
             # It requires a word ending in 's|ss + es'
             # Removes '-es' and look up in the set
-            elif word_es and word_es[0][1] == 's' and word_es[0][0] in vocab.singular.only_ending_s:
+            elif word_es and word_es[0][1] == 's' and word_es[0][0] in attrib.only_ending_s:
                 val = word_es[0][0]
                 cur_data = {
                     "id": 140,
@@ -157,7 +273,7 @@ def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
                 }
             # It requires a word ending in 'ch|sh|x|z + es'
             # Removes '-es' and look up in the set
-            elif word_es and word_es[0][1] != 's' and word_es[0][0] in vocab.singular.singular_ending_non_s:
+            elif word_es and word_es[0][1] != 's' and word_es[0][0] in attrib.singular_ending_non_s:
                 val = word_es[0][0]
                 cur_data = {
                     "id": 150,
@@ -189,6 +305,30 @@ def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
                     "pair": cur_word + " - " + val
                 }
 
+    return cur_data
+
+# Singularize a word
+def get_singular(word: str, vocab: vcb.VocabConfig) -> dict:
+    """ Convert a word to its singular form.
+
+    Alphanumeric words are dispatched on their suffix to the only rules that can match them.
+    Other words go through the regular expression cascade. Both give the same results.
+
+    Args:
+        word (str): The input word may be modified
+        vocab (VocabConfig): 'Vocabulary configuration' object
+    Returns:
+        dict: Processed data
+    """
+
+    cur_range = cns.RANGE_SINGULAR_ID
+    cur_word = word.lower().strip()
+
+    if cur_word.isascii() and cur_word.isalnum():
+        cur_data = _dispatch_singular(cur_word, vocab.singular)
+    else:
+        cur_data = _match_singular(cur_word, vocab.singular)
+
     # If data has changed
     if cur_data['id'] != cns.UNCHANGED_DATA_ID:
         # Log the word transformation pair
@@ -0,0 +1,31 @@
+import re
+from src.myvocab.constants import constants as cns
+
+# Isolated English words, numbers and hyphenated compounds
+_TOKEN_PATTERN = re.compile(r'\b[a-zA-Z0-9-]+\b')
+# A token starting with a number (e.g., 1980, 12-abc)
+_NUMBER_PATTERN = re.compile(r'\b[0-9]+\b')
+
+def get_tokens(line: str) -> list:
+    """ Split a line into classified tokens in a single scan.
+
+    A token starting with a number is classified as a number.
+    A token containing a hyphen and at least one non-empty part is classified as a hyphenated compound.
+    Any other token is classified as a plain word.
+
+    Args:
+        line (str): A line enclosed in the <<word>> and <</word>> tag-only strings.
+    Returns:
+        list: Tuples of the token type, the lowercase token,
+            and the non-empty parts of a hyphenated compound (an empty tuple for other types).
+    """
+
+    tokens = list()
+    for word in _TOKEN_PATTERN.findall(line.lower()):
+        if '0' <= word[0] <= '9' and _NUMBER_PATTERN.match(word):
+            tokens.append((cns.TOKEN_NUMBER, word, ()))
+        elif '-' in word and (parts := tuple(part for part in word.split('-') if part != "")):
+            tokens.append((cns.TOKEN_COMPOUND, word, parts))
+        else:
+            tokens.append((cns.TOKEN_WORD, word, ()))
+    return tokens
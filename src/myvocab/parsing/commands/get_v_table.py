@@ -0,0 +1,77 @@
+import logging
+from pathlib import Path
+import re
+from src.myvocab.exceptions import exceptions as exc
+from src.myvocab.parsing.commands.get_verbs_s import get_verbs_s
+
+logger = logging.getLogger(__name__)
+
+# Parsed tables by file path and delimiter, with the file state they were parsed from
+_table_cache = dict()
+
+def get_v_table(file_path: Path, delimiter: str = " ") -> dict:
+    """ Get all column maps of a tabular data file in a single pass.
+
+    `file_path` is a delimited text file where each line has a fixed number of words.
+    The position of each word determines its table column (V1, V2, etc.).
+    Each file line number corresponds to its table row.
+    Multiple values in one column are separated by a forward slash ('/').
+
+    The table is parsed once and reused until the file size or modification time changes.
+    The returned table is shared, so it must not be modified.
+
+    Args:
+        file_path (Path): A tabular data file (like CSV).
+        delimiter (str, optional): The delimiter used to separate words. Defaults to " ".
+    Returns:
+        dict: Maps with 'V_Number' keys to 'V1' values for each column in the 'columns' field,
+            keys of the first three maps ending in '-s' in the 'verbs_s' field,
+            and the split rows in the 'rows' field.
+    """
+
+    if not file_path.exists():
+        raise exc.DirectoryNotExistError(file_path.resolve())
+    if file_path.is_dir():
+        raise exc.DirectoryIsNotFileError(file_path.resolve())
+
+    stat = file_path.stat()
+    key = (str(file_path.resolve()), delimiter)
+    state = (stat.st_size, stat.st_mtime_ns)
+    if (cached := _table_cache.get(key)) is not None and cached[0] == state:
+        return cached[1]
+
+    if len(delimiter) > 1:
+        delimiter = delimiter.strip()
+        if delimiter == "":
+            delimiter = " "
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+        line_list = re.findall(r'(.+)\n*', content)
+
+    columns = list()
+    rows = list()
+    for line in line_list:
+        if delimiter == " ":
+            split_tuple = re.split(r' +', line)
+        else:
+            split_tuple = re.split(fr' +{delimiter} +', line)
+        rows.append(split_tuple)
+
+        # V1
+        v_1 = re.split(r'/', split_tuple[0].strip().lower())[0]
+        for v_number, v_num in enumerate(split_tuple):
+            if v_number == len(columns):
+                columns.append(dict())
+            # Multiple values in one column
+            for item in re.split(r'/', v_num.strip().lower()):
+                if item != "":
+                    columns[v_number][item] = v_1
+
+    verbs_s = set()
+    for column in columns[:3]:
+        verbs_s.update(get_verbs_s(column))
+
+    table = {"columns": columns, "verbs_s": verbs_s, "rows": rows}
+    _table_cache[key] = (state, table)
+    return table
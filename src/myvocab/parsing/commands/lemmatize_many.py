@@ -0,0 +1,46 @@
+from collections.abc import Iterable
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+from src.myvocab.parsing.commands.get_init_data import get_init_data
+from src.myvocab.parsing.commands.set_transformer import set_transformer
+from src.myvocab.parsing.commands.get_reviewed_data import get_reviewed_data
+
+def lemmatize_many(words: Iterable, vocab: vcb.VocabConfig) -> dict:
+    """ Process distinct words through the first fitted transformer in one pass.
+
+    A word containing a hyphen is processed as a hyphenated compound, part by part
+    (e.g., passers-by; strong-willed), unless the whole compound has been reviewed.
+    Each distinct word and compound part is processed once.
+
+    Args:
+        words (Iterable): Lowercase words and hyphenated compounds
+        vocab (VocabConfig): 'Vocabulary configuration' object
+    Returns:
+        dict: Processed data of each distinct word (word -> processed data)
+    """
+
+    lemmas = dict()
+    # Processed words of the hyphenated compound parts
+    part_words = dict()
+
+    for word in words:
+        if word in lemmas:
+            continue
+
+        # Reviewed words and hyphenated compounds skip the rules
+        if (transform_data := get_reviewed_data(word, vocab)) is None:
+            if '-' in word and (parts := [part for part in word.split('-') if part != ""]):
+                # Hyphenated compound
+                for part in parts:
+                    if part not in part_words:
+                        part_words[part] = set_transformer(part, vocab)["word"]
+                phrase = "-".join(part_words[part] for part in parts)
+                # Keep the resulting Hyphenated compounds and their parsing pair
+                transform_data = get_init_data(phrase)
+                if phrase != word:
+                    transform_data["pair"] = word + " - " + phrase
+            else:
+                transform_data = set_transformer(word, vocab)
+
+        lemmas[word] = transform_data
+
+    return lemmas
@@ -0,0 +1,42 @@
+import logging
+import sqlite3
+from contextlib import closing
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+
+logger = logging.getLogger(__name__)
+
+def load_lemma_cache(vocab: vcb.VocabConfig, fingerprint: str) -> dict:
+    """ Load word transformations of the previous runs.
+
+    The cache is cleared if it was created with other reference word lists or transformer flags.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+        fingerprint (str): Fingerprint of the current parsing rules
+    Returns:
+        dict: Map of words to processed data with 'id', 'word', and 'pair' fields.
+    """
+
+    lemmas = dict()
+    if vocab.lemma_cache_size <= 0 or not vocab.lemma_cache_file.is_file():
+        return lemmas
+
+    try:
+        with closing(sqlite3.connect(vocab.lemma_cache_file)) as connection:
+            row = connection.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+            if row is None or row[0] != fingerprint:
+                logger.info("Reference word lists have changed, the lemma cache is cleared.")
+                with connection:
+                    connection.execute("DELETE FROM lemmas")
+                    connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)", (fingerprint,))
+                return lemmas
+
+            for word, lemma_id, lemma, pair in connection.execute(
+                    "SELECT word, id, lemma, pair FROM lemmas ORDER BY used DESC LIMIT ?", (vocab.lemma_cache_size,)):
+                lemmas[word] = {"id": lemma_id, "word": lemma, "pair": pair}
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to read the lemma cache: {vocab.lemma_cache_file}: {e}")
+        return dict()
+
+    logger.info(f"Lemma cache entries loaded: {len(lemmas)}")
+    return lemmas
@@ -0,0 +1,33 @@
+import json
+import logging
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+
+logger = logging.getLogger(__name__)
+
+def load_manifest(vocab: vcb.VocabConfig, fingerprint: str) -> dict:
+    """ Load the per-file manifest of the previous run.
+
+    The manifest is discarded if it was created with other parsing rules.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+        fingerprint (str): Fingerprint of the current parsing rules
+    Returns:
+        dict: Map of relative file paths to their stat, hash and parsed data.
+    """
+
+    if not vocab.manifest_file.is_file():
+        return dict()
+
+    try:
+        with open(vocab.manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read the manifest file: {vocab.manifest_file}: {e}")
+        return dict()
+
+    if manifest.get("fingerprint") != fingerprint:
+        logger.info("Parsing rules have changed, all files will be parsed.")
+        return dict()
+
+    return manifest.get("files", dict())
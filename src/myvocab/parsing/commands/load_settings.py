@@ -5,6 +5,8 @@ from src.myvocab.exceptions import exceptions as exc
 from src.myvocab.validators import validators as vld
 from src.myvocab.constants import constants as cns
 from src.myvocab.parsing.commands.write_settings import write_settings
+from src.myvocab.translation.translation_yandex.language_catalogue import get_language_catalogue
+from src.myvocab.authentication.auth_yandex.iam_token_provider import get_token_provider
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,7 @@ def load_settings(vocab: vcb.VocabConfig) -> None:
     if not vocab.settings_file.exists():
         write_settings(vocab)
 
+    target_language_code = None
     with open(vocab.settings_file, "r", encoding='utf-8') as file:
         content = file.read()
         for word in re.findall(r' *(.+?) *= *(.+) *', content):
@@ -45,15 +48,8 @@ def load_settings(vocab: vcb.VocabConfig) -> None:
                 except exc.VocabError as e:
                     logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
             elif word[0].strip() == 'target_language_code':
-                try:
-                    target_language = vld.validate_target_language_code(word[1].strip(), vocab.target_languages_file)
-                    vocab.target_language_code = target_language[0]
-                    vocab.target_language = target_language[1]
-                except exc.TargetLanguageCodeIsNotFoundError as e:
-                    vocab.use_word_translate = False
-                    logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
-                except exc.VocabError as e:
-                    logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
+                # Validated after all options are loaded
+                target_language_code = word[1].strip()
             elif word[0].strip() == 'use_lemma_singular':
                 try:
                     vld.validate_bool_value(cns.BOOLEAN_STRINGS, word[1].strip())
@@ -82,4 +78,88 @@ def load_settings(vocab: vcb.VocabConfig) -> None:
                     except exc.VocabError as e:
                         logger.warning(f"Warning: {e}")
                 except exc.VocabError as e:
-                    logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
\ No newline at end of file
+                    logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
+            elif word[0].strip() == 'use_file_manifest':
+                try:
+                    vld.validate_bool_value(cns.BOOLEAN_STRINGS, word[1].strip())
+                    vocab.use_file_manifest = (word[1].strip().lower() in cns.TRUTH_STRINGS)
+                except exc.VocabError as e:
+                    logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
+            elif word[0].strip() == 'lemma_cache_size':
+                try:
+                    vld.validate_int_value(word[1].strip(), 0, word[0].strip())
+                    vocab.lemma_cache_size = int(word[1].strip())
+                except exc.VocabError as e:
+                    logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
+            elif word[0].strip() == 'parse_workers':
+                try:
+                    vld.validate_int_value(word[1].strip(), 0, word[0].strip())
+                    vocab.parse_workers = int(word[1].strip())
+                except exc.VocabError as e:
+                    logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
+            elif word[0].strip() == 'use_translation_cache':
+                try:
+                    vld.validate_bool_value(cns.BOOLEAN_STRINGS, word[1].strip())
+                    vocab.use_translation_cache = (word[1].strip().lower() in cns.TRUTH_STRINGS)
+                except exc.VocabError as e:
+                    logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
+            elif word[0].strip() == 'translate_workers':
+                try:
+                    vld.validate_int_value(word[1].strip(), 1, word[0].strip())
+                    vocab.translate_workers = int(word[1].strip())
+                except exc.VocabError as e:
+                    logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
+            elif word[0].strip() == 'use_iam_token_cache':
+                try:
+                    vld.validate_bool_value(cns.BOOLEAN_STRINGS, word[1].strip())
+                    vocab.use_iam_token_cache = (word[1].strip().lower() in cns.TRUTH_STRINGS)
+                except exc.VocabError as e:
+                    logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
+            elif word[0].strip() == 'languages_ttl_days':
+                try:
+                    vld.validate_int_value(word[1].strip(), 0, word[0].strip())
+                    vocab.languages_ttl_days = int(word[1].strip())
+                except exc.VocabError as e:
+                    logger.warning(f"Invalid processing option '{word[0].strip()}': {e}")
+
+    # The target languages are validated once `use_word_translate` and `languages_ttl_days` are loaded
+    is_translate = vocab.use_word_translate
+    is_not_found = False
+    if target_language_code is not None:
+        target_languages = list()
+        # A comma-separated list of codes, duplicates are skipped
+        for code in dict.fromkeys(item.strip() for item in target_language_code.split(',') if item.strip()):
+            try:
+                target_languages.append(vld.validate_target_language_code(code, vocab.target_languages_file))
+            except exc.TargetLanguageCodeIsNotFoundError as e:
+                # An unsupported code is skipped
+                is_not_found = True
+                logger.warning(f"Invalid processing option 'target_language_code': {e}")
+            except exc.VocabError as e:
+                logger.warning(f"Invalid processing option 'target_language_code': {e}")
+        if target_languages:
+            vocab.target_languages = target_languages
+        else:
+            # No supported target language, the default one is kept
+            vocab.use_word_translate = False
+
+    # The supported languages are fetched only when translation is requested
+    if is_translate:
+        refresh_target_languages(vocab, is_not_found)
+
+def refresh_target_languages(vocab: vcb.VocabConfig, is_not_found: bool = False) -> None:
+    """ Fetch the supported languages in the background if they are out of date or a target language is not found.
+
+    The languages are fetched only when translation is enabled, with the IAM token kept between runs.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+        is_not_found (bool): A target language code is not in the supported languages
+    """
+
+    catalogue = get_language_catalogue(vocab.target_languages_file)
+    catalogue.ttl_days = vocab.languages_ttl_days
+    if is_not_found or catalogue.is_stale:
+        token_provider = get_token_provider()
+        token_provider.cache_file = vocab.iam_token_file if vocab.use_iam_token_cache else None
+        catalogue.refresh_in_background()
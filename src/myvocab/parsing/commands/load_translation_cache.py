@@ -0,0 +1,44 @@
+import logging
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+
+logger = logging.getLogger(__name__)
+
+def load_translation_cache(vocab: vcb.VocabConfig, items: list, word_indices: Iterable, target_language_code: str = None) -> dict:
+    """ Load translations of the previous runs for the words to translate.
+
+    Translations are looked up by the word and the translation direction.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+        items (list): Vocabulary lines.
+        word_indices (Iterable): Indices of the words to translate in `items`.
+        target_language_code (str): Target language code, by default the main target language.
+    Returns:
+        dict: Map of the found words to their translations.
+    """
+
+    if target_language_code is None:
+        target_language_code = vocab.target_language_code
+
+    translations = dict()
+    words = {items[index] for index in word_indices}
+    if not vocab.translation_cache_file.is_file():
+        logger.info(f"Translation cache `{target_language_code}`: 0 hits, {len(words)} misses")
+        return translations
+
+    try:
+        with closing(sqlite3.connect(vocab.translation_cache_file)) as connection:
+            for word, translation in connection.execute(
+                    "SELECT word, translation FROM translations WHERE source = ? AND target = ?",
+                    (vocab.source_language_code, target_language_code)):
+                if word in words:
+                    translations[word] = translation
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to read the translation cache: {vocab.translation_cache_file}: {e}")
+        translations.clear()
+
+    logger.info(f"Translation cache `{target_language_code}`: {len(translations)} hits, {len(words) - len(translations)} misses")
+    return translations
@@ -0,0 +1,121 @@
+from pathlib import Path
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+from src.myvocab.constants import constants as cns
+from src.myvocab.parsing.commands.lemmatize_many import lemmatize_many
+from src.myvocab.parsing.commands.add_pair import add_pair
+from src.myvocab.parsing.commands.read_file_lines import read_file_lines
+from src.myvocab.parsing.commands.get_tokens import get_tokens
+
+def parse_file(file_path: Path, vocab: vcb.VocabConfig, transform_dict: dict) -> dict:
+    """ Parse a text file into vocabulary lines.
+
+    Any text outside the <<word>> and <</word>> tag-only strings is treated as raw file lines.
+    Text enclosed in <<word>> and <</word>> tag-only strings is interpreted as a list of isolated English words.
+
+    Args:
+        file_path (Path): Text file path
+        vocab (VocabConfig): 'Vocabulary configuration' object
+        transform_dict (dict): Caching transformations for reuse (word -> processed data)
+    Returns:
+        dict: Unique file lines in the 'lines' field, word pairs in the 'pairs' field,
+            and transformations of the words used in the file in the 'lemmas' field.
+            With translation, the indices of the lines to translate are in the 'words' field;
+            in the ordered vocabulary the words follow the raw lines.
+    """
+
+    # With translation, the words of the ordered vocabulary are kept apart from the raw lines
+    is_word_set = vocab.use_word_translate and vocab.use_order_text
+
+    parsed_pairs = {
+        "singular": set(),
+        "infinit": set()
+    }
+
+    # Distinct raw lines and word tokens in the order of their first appearance
+    file_items = dict()
+
+    t_word = False
+    # Read lines from a file lazily
+    for file_line in read_file_lines(file_path):
+        if file_line == cns.TAG_WORD:
+            t_word = True
+            continue
+        elif file_line == cns.TAG_END_WORD:
+            t_word = False
+            continue
+
+        if t_word:
+            # Tokens are tuples, so they never collide with raw lines
+            for token in get_tokens(file_line):
+                file_items[token] = None
+        else:
+            file_line = file_line.strip()
+            if file_line != '':
+                file_items[file_line] = None
+
+    use_lemma = vocab.use_lemma_infinit or vocab.use_lemma_singular
+
+    # Transformations of the words used in this file
+    file_lemmas = dict()
+    if use_lemma:
+        # Words that have not been processed before
+        new_words = list()
+        for item in file_items:
+            # Exclude raw lines and numbers
+            if isinstance(item, str) or item[0] == cns.TOKEN_NUMBER:
+                continue
+            if (transform_data := transform_dict.get(item[1])) is None:
+                new_words.append(item[1])
+            else:
+                file_lemmas[item[1]] = transform_data
+        # Lemmatize each distinct word exactly once; in a process pool the batch is per file (see `parse_files`)
+        new_lemmas = lemmatize_many(new_words, vocab)
+        transform_dict.update(new_lemmas)
+        file_lemmas.update(new_lemmas)
+        for transform_data in file_lemmas.values():
+            add_pair(transform_data, parsed_pairs)
+
+    file_list = list()
+    file_set = set()
+    word_set = set()
+    # Indices of the words to translate in `file_list`
+    file_words = list()
+
+    for item in file_items:
+        if isinstance(item, str):
+            if vocab.use_order_text:
+                file_set.add(item)
+            elif item not in file_set:
+                file_list.append(item)
+                file_set.add(item)
+            continue
+
+        token_type, word, parts = item
+        if use_lemma:
+            # Exclude numbers
+            if token_type == cns.TOKEN_NUMBER:
+                continue
+            # Word processing using Transformers
+            word = file_lemmas[word]["word"]
+
+        if is_word_set:
+            word_set.add(word)
+        elif vocab.use_order_text:
+            file_set.add(word)
+        elif word not in file_set:
+            if vocab.use_word_translate:
+                file_words.append(len(file_list))
+            file_list.append(word)
+            file_set.add(word)
+
+    if vocab.use_order_text:
+        file_list = list(file_set)
+        file_words = list(range(len(file_list), len(file_list) + len(word_set)))
+        file_list.extend(word_set)
+
+    return {
+        "lines": file_list,
+        "words": file_words,
+        "pairs": parsed_pairs,
+        "lemmas": file_lemmas
+    }
@@ -0,0 +1,68 @@
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+from src.myvocab.parsing.commands.parse_file import parse_file
+
+# Worker process state, set once by the pool initializer
+_worker_vocab: vcb.VocabConfig = None
+_worker_transform_dict: dict = None
+
+def _init_worker(vocab: vcb.VocabConfig, transform_dict: dict) -> None:
+    """ Keep the vocabulary configuration and the transformation cache in the worker process. """
+
+    global _worker_vocab, _worker_transform_dict
+    _worker_vocab = vocab
+    _worker_transform_dict = transform_dict
+
+def _parse_worker(file_path: Path) -> dict:
+    """ Parse a text file in the worker process. """
+
+    return parse_file(file_path, _worker_vocab, _worker_transform_dict)
+
+def get_parse_workers(vocab: vcb.VocabConfig) -> int:
+    """ Get the number of worker processes for parsing files.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+    Returns:
+        int: Number of worker processes (0 in the settings means all CPU cores).
+    """
+
+    if vocab.parse_workers == 0:
+        return os.cpu_count() or 1
+    return vocab.parse_workers
+
+def parse_files(vocab: vcb.VocabConfig, file_paths: list, transform_dict: dict = None) -> Iterator[dict]:
+    """ Parse text files serially or in a process pool.
+
+    Results are yielded in the order of `file_paths`, so the output does not depend on the number of workers.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+        file_paths (list): Text file paths
+        transform_dict (dict, optional): Transformations known before parsing (word -> processed data).
+    Yields:
+        dict: Parsed data of each file (see `parse_file`).
+    """
+
+    workers = min(get_parse_workers(vocab), len(file_paths))
+
+    # Caching transformations for reuse
+    if transform_dict is None:
+        transform_dict = dict()
+
+    if workers <= 1:
+        for file_path in file_paths:
+            yield parse_file(file_path, vocab, transform_dict)
+        return
+
+    # Each worker keeps its copy of `transform_dict` across its files, so a word is lemmatized at most once per worker,
+    # not once per run. Collecting the distinct words of all files first would send every token to the main process
+    # and build the file data there: on 200 files of 20,000 tokens it saved ~0.2 s of lemmatization (~1 us per word)
+    # and added ~2 s of inter-process traffic, so the words are batched per file (see `parse_file`) instead.
+    # Send files to the workers in batches to reduce inter-process overhead
+    chunksize = max(1, len(file_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(vocab, transform_dict)) as executor:
+        yield from executor.map(_parse_worker, file_paths, chunksize=chunksize)
@@ -0,0 +1,37 @@
+from collections.abc import Iterator
+from pathlib import Path
+from src.myvocab.constants import constants as cns
+
+def read_file_lines(file_path: Path, chunk_size: int = cns.READ_CHUNK_SIZE) -> Iterator[str]:
+    """ Read non-empty lines from a text file lazily.
+
+    The file is read in chunks, so memory usage is bounded by the chunk size (and the longest line),
+    not by the file size. A line split between two chunks is joined before it is yielded.
+
+    Args:
+        file_path (Path): Text file path
+        chunk_size (int, optional): Number of characters read at once. Defaults to `cns.READ_CHUNK_SIZE`.
+    Yields:
+        str: Non-empty lines without the line break.
+    """
+
+    # Parts of the line that continues in the next chunk
+    carry = list()
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        while chunk := f.read(chunk_size):
+            lines = chunk.split('\n')
+            # The last part has no line break yet
+            tail = lines.pop()
+            if lines and carry:
+                carry.append(lines[0])
+                lines[0] = "".join(carry)
+                carry.clear()
+            for line in lines:
+                if line != '':
+                    yield line
+            if tail != '':
+                carry.append(tail)
+
+    if carry:
+        yield "".join(carry)
@@ -1,11 +1,14 @@
+from collections.abc import Iterable
 from pathlib import Path
 
-def save_file(file_path: Path, items: list, is_sorted: bool) -> None:
+def save_file(file_path: Path, items: Iterable, is_sorted: bool) -> None:
     """ Write a list to a file.
 
+        Items are written as they are iterated unless sorting is requested.
+
         Args:
             file_path (Path): Path to the file
-            items (list): Items to save
+            items (Iterable): Items to save
             is_sorted (bool): Sorting option
     """
 
@@ -0,0 +1,52 @@
+import logging
+import sqlite3
+from contextlib import closing
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+
+logger = logging.getLogger(__name__)
+
+def save_lemma_cache(vocab: vcb.VocabConfig, fingerprint: str, lemmas: dict) -> None:
+    """ Write word transformations used in this run to the cache.
+
+    Each entry is marked with the run number. The least recently used entries
+    are evicted when the cache exceeds 'vocab.lemma_cache_size'.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+        fingerprint (str): Fingerprint of the current parsing rules
+        lemmas (dict): Map of words to processed data with 'id', 'word', and 'pair' fields.
+    """
+
+    if vocab.lemma_cache_size <= 0:
+        return
+
+    if not vocab.lemma_cache_file.parent.exists():
+        vocab.lemma_cache_file.parent.mkdir(exist_ok = True, parents = True)
+
+    try:
+        with closing(sqlite3.connect(vocab.lemma_cache_file)) as connection, connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            connection.execute("CREATE TABLE IF NOT EXISTS lemmas "
+                               "(word TEXT PRIMARY KEY, id INTEGER, lemma TEXT, pair TEXT, used INTEGER)")
+            connection.execute("CREATE INDEX IF NOT EXISTS lemmas_used ON lemmas (used)")
+
+            row = connection.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+            if row is None or row[0] != fingerprint:
+                connection.execute("DELETE FROM lemmas")
+                connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)", (fingerprint,))
+
+            # The run number orders the entries from the least to the most recently used
+            row = connection.execute("SELECT value FROM meta WHERE key = 'run'").fetchone()
+            run = int(row[0]) + 1 if row else 1
+            connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('run', ?)", (str(run),))
+
+            connection.executemany(
+                "INSERT OR REPLACE INTO lemmas (word, id, lemma, pair, used) VALUES (?, ?, ?, ?, ?)",
+                ((word, data["id"], data["word"], data["pair"], run) for word, data in lemmas.items()))
+
+            # Evict the least recently used entries
+            connection.execute(
+                "DELETE FROM lemmas WHERE word IN "
+                "(SELECT word FROM lemmas ORDER BY used DESC LIMIT -1 OFFSET ?)", (vocab.lemma_cache_size,))
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to write the lemma cache: {vocab.lemma_cache_file}: {e}")
@@ -0,0 +1,33 @@
+import json
+import logging
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+
+logger = logging.getLogger(__name__)
+
+def save_manifest(vocab: vcb.VocabConfig, fingerprint: str, files: dict) -> None:
+    """ Write the per-file manifest to a file.
+
+    Save the manifest to 'vocab.manifest_file'.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+        fingerprint (str): Fingerprint of the current parsing rules
+        files (dict): Map of relative file paths to their stat, hash and parsed data.
+    """
+
+    if not vocab.manifest_file.parent.exists():
+        vocab.manifest_file.parent.mkdir(exist_ok = True, parents = True)
+
+    manifest = {
+        "fingerprint": fingerprint,
+        "files": files
+    }
+
+    # Replace the manifest atomically, so an interrupted run leaves the previous one intact
+    temp_file = vocab.manifest_file.with_name(vocab.manifest_file.name + ".tmp")
+    try:
+        with open(temp_file, "w", encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        temp_file.replace(vocab.manifest_file)
+    except Exception as e:
+        logger.exception(f"Failed to write file: {vocab.manifest_file}: {type(e)} {e}")
@@ -0,0 +1,34 @@
+import logging
+import sqlite3
+from contextlib import closing
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+
+logger = logging.getLogger(__name__)
+
+def save_translation_cache(vocab: vcb.VocabConfig, translations: dict, target_language_code: str = None) -> None:
+    """ Write translations to the cache for the translation direction.
+
+    Args:
+        vocab (VocabConfig): 'Vocabulary configuration' object
+        translations (dict): Map of words to their translations.
+        target_language_code (str): Target language code, by default the main target language.
+    """
+
+    if target_language_code is None:
+        target_language_code = vocab.target_language_code
+
+    if not vocab.translation_cache_file.parent.exists():
+        vocab.translation_cache_file.parent.mkdir(exist_ok = True, parents = True)
+
+    try:
+        with closing(sqlite3.connect(vocab.translation_cache_file)) as connection, connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS translations "
+                               "(word TEXT, source TEXT, target TEXT, translation TEXT, "
+                               "PRIMARY KEY (word, source, target))")
+            # Failed translations are not cached
+            connection.executemany(
+                "INSERT OR REPLACE INTO translations (word, source, target, translation) VALUES (?, ?, ?, ?)",
+                ((word, vocab.source_language_code, target_language_code, translation)
+                 for word, translation in translations.items() if translation))
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to write the translation cache: {vocab.translation_cache_file}: {e}")
@@ -0,0 +1,40 @@
+from src.myvocab.parsing.vocabulary import vocabulary as vcb
+from src.myvocab.constants import constants as cns
+from src.myvocab.parsing.commands.get_singular import get_singular
+from src.myvocab.parsing.commands.get_infinit import get_infinit
+from src.myvocab.parsing.commands.get_init_data import get_init_data
+from src.myvocab.parsing.commands.get_reviewed_data import get_reviewed_data
+
+def set_transformer(word: str, vocab: vcb.VocabConfig) -> dict:
+    """ Process a word through the first fitted transformer.
+
+    Words found in the reviewed pairs of an enabled transformer get their reviewed form without any rule.
+
+    Args:
+        word (str): The input word
+        vocab (VocabConfig): 'Vocabulary configuration' object
+    Returns:
+        dict: Processed data
+    """
+
+    # Human-verified transformations skip the rule cascades
+    if (vdata := get_reviewed_data(word, vocab)) is not None:
+        return vdata
+
+    vdata = get_init_data(word)
+
+    # Singular-transformer
+    if vocab.use_lemma_singular:
+        # Skip singularizing verbs ending in -s
+        if word not in vocab.verbs_ending_s:
+            vdata = get_singular(word, vocab)
+            if vdata["id"] != cns.UNCHANGED_DATA_ID:
+                return vdata
+
+    # Infinite-transformer
+    if vocab.use_lemma_infinit:
+        vdata = get_infinit(word, vocab)
+        if vdata["id"] != cns.UNCHANGED_DATA_ID:
+            return vdata
+
+    return vdata
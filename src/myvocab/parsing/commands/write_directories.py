@@ -1,21 +1,18 @@
 import logging
-from pathlib import Path
 import re
 from src.myvocab.parsing.vocabulary import vocabulary as vcb
 from src.myvocab.exceptions import exceptions as exc
-from src.myvocab.validators import validators as vld
-from src.myvocab.utils.walk_handler.handle_error import handle_error
-from src.myvocab.parsing.commands.skip_current_dir import skip_current_dir
 
 logger = logging.getLogger(__name__)
 
-def write_directories(vocab: vcb.VocabConfig):
+def write_directories(vocab: vcb.VocabConfig, directories: list):
     """ Write the directory structure to a file.
 
     Save the directory structure to 'vocab.directories_file'.
 
     Args:
         vocab (VocabConfig): 'Vocabulary configuration' object
+        directories (list): Included directories and text files (see `discover_directories`)
     """
 
     if vocab.directories_file.is_dir():
@@ -33,20 +30,9 @@ def write_directories(vocab: vcb.VocabConfig):
             old_lines = re.findall(f'{mark_file} (.+txt) *(V+)', content)
 
     old_dict = dict(old_lines)
-    offset = len(vocab.base_directory.parts) - 1
-    # If the PyInstaller executable sets the base directory to '.'
-    if offset < 0:
-        offset = 0
 
-    # Path.walk traverses the directory tree, starting from the base
-    for dirpath, dirs, files in Path.walk(vocab.base_directory, on_error = handle_error):
+    for dirpath, dirpath_parts, files in directories:
 
-        dirpath_parts = Path(*dirpath.parts[offset::])
-
-        # Check if the current directory should be ignored
-        if skip_current_dir(vocab, dirpath, dirpath_parts):
-            continue
-            
         # Determine the nesting level
         level = len(dirpath.parts) - len(vocab.base_directory.parts)
         # Set the indentation to 4 spaces per level
@@ -65,18 +51,6 @@ def write_directories(vocab: vcb.VocabConfig):
 
         # List the file names
         for file in files:
-
-            # Text files only
-            if not file.endswith(".txt"):
-                continue
-         
-            try:
-                # The current filename has the leading exclamation mark and the 'use_folder_with_leading_exclamation_mark' option is set to false
-                cur_path = Path.joinpath(dirpath_parts, file)
-                vld.validate_directory_with_leading_exclamation_mark(cur_path, vocab.use_folder_with_leading_exclamation_mark)
-            except exc.VocabError:
-                continue
-
             if old_dict.get(file):
                 vend = ' ' + old_dict.get(file)
             else:
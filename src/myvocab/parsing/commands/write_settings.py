@@ -23,9 +23,16 @@ def write_settings(vocab: vcb.VocabConfig) -> None:
                 f"use_lemma_singular = {vocab.use_lemma_singular}\n"
                 f"use_lemma_infinit = {vocab.use_lemma_infinit}\n"
                 f"use_word_translate = {vocab.use_word_translate}\n"
-                f"target_language_code = {vocab.target_language_code}\n"
+                f"target_language_code = {", ".join(code for code, name in vocab.target_languages)}\n"
                 f"use_order_text = {vocab.use_order_text}\n"
-                f"use_folder_with_leading_exclamation_mark = {vocab.use_folder_with_leading_exclamation_mark}"
+                f"use_folder_with_leading_exclamation_mark = {vocab.use_folder_with_leading_exclamation_mark}\n"
+                f"use_file_manifest = {vocab.use_file_manifest}\n"
+                f"lemma_cache_size = {vocab.lemma_cache_size}\n"
+                f"parse_workers = {vocab.parse_workers}\n"
+                f"use_translation_cache = {vocab.use_translation_cache}\n"
+                f"translate_workers = {vocab.translate_workers}\n"
+                f"use_iam_token_cache = {vocab.use_iam_token_cache}\n"
+                f"languages_ttl_days = {vocab.languages_ttl_days}"
                 )
             file.write(cur_str)
     except Exception as e:
@@ -6,7 +6,9 @@ from src.myvocab.parsing.commands.save_file import save_file
 from src.myvocab.parsing.commands.get_v_tuple import get_v3
 from src.myvocab.parsing.commands.get_v_tuple import get_v2
 from src.myvocab.parsing.commands.get_v_tuple import get_v1
-from src.myvocab.parsing.commands.get_verbs_s import get_verbs_s
+from src.myvocab.parsing.commands.get_v_table import get_v_table
+from src.myvocab.parsing.commands.get_reviewed_pairs import get_reviewed_pairs
+from src.myvocab.utils.snapshot_handler.reference_snapshot import ReferenceSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,7 @@ class InfinitAttrib:
     __only_ending_ed: set = None
     __verbs_ending_e: set = None
     __verbs_ending_non_ed: set = None
+    __reviewed_pairs: dict = None
 
     def __init__(self, dir_unique_id: str):
         """ Initialize the `Infinitive transformation configuration`.
@@ -31,6 +34,7 @@ class InfinitAttrib:
         """
         self.__dir_unique_id = dir_unique_id
         self.initialize()
+        self.__snapshot = ReferenceSnapshot(self.snapshot_path)
 
     @classmethod
     def infinit_attrib_verbs_ending_s(cls) -> set:
@@ -39,12 +43,8 @@ class InfinitAttrib:
         data_irregular_verbs_path: Path = Path.joinpath(data_path, "irregular_verbs.txt")
         cur_set = set()
         try:
-            verbs = get_v1(data_irregular_verbs_path)
-            cur_set.update(get_verbs_s(verbs))
-            verbs = get_v2(data_irregular_verbs_path)
-            cur_set.update(get_verbs_s(verbs))
-            verbs = get_v3(data_irregular_verbs_path)
-            cur_set.update(get_verbs_s(verbs))
+            # All columns are parsed once and shared with the verb maps
+            cur_set.update(get_v_table(data_irregular_verbs_path)["verbs_s"])
         except Exception as e:
             logger.warning(f"Error while searching verbs ending -s: {e}")
             if not isinstance(cur_set, set):
@@ -56,12 +56,8 @@ class InfinitAttrib:
         """ Get irregular verbs ending in -s from the external /Documents directory. """
         cur_set = set()
         try:
-            verbs = get_v1(self.irregular_verbs_path)
-            cur_set.update(get_verbs_s(verbs))
-            verbs = get_v2(self.irregular_verbs_path)
-            cur_set.update(get_verbs_s(verbs))
-            verbs = get_v3(self.irregular_verbs_path)
-            cur_set.update(get_verbs_s(verbs))
+            # All columns are parsed once and shared with the verb maps
+            cur_set.update(self.__snapshot.get(self.irregular_verbs_path, get_v_table)["verbs_s"])
         except Exception as e:
             logger.warning(f"Error while searching verbs ending -s: {e}")
             if not isinstance(cur_set, set):
@@ -81,6 +77,11 @@ class InfinitAttrib:
         else:
             return Path.joinpath(self.__home, self.__dir_unique_id, "Infinitive")
 
+    @property
+    def snapshot_path(self):
+        """ Get /Documents/Infinitive/reference_lists.pickle directory. """
+        return Path.joinpath(self.infinitive_path, "reference_lists.pickle")
+
     # infinitive in
     @property
     def infinitive_in_path(self):
@@ -144,7 +145,7 @@ class InfinitAttrib:
         For example, the 'invariable -ed endings' rule correctly excludes the noun 'bed' from processing.
         """
         if self.__only_ending_ed is None:
-            self.__only_ending_ed = get_file_unique_lines(self.only_ending_ed_path)
+            self.__only_ending_ed = self.__snapshot.get(self.only_ending_ed_path, get_file_unique_lines)
         return self.__only_ending_ed
 
     @property
@@ -155,7 +156,7 @@ class InfinitAttrib:
         For instance, the 'ending -e' rule correctly handles the verb 'freed', turning it into 'free'.
         """
         if self.__verbs_ending_e is None:
-            self.__verbs_ending_e = get_file_unique_lines(self.verbs_ending_e_path)
+            self.__verbs_ending_e = self.__snapshot.get(self.verbs_ending_e_path, get_file_unique_lines)
         return self.__verbs_ending_e
 
     @property
@@ -167,30 +168,56 @@ class InfinitAttrib:
         The 'not ending in -ed' rule correctly handles the verb 'willed', turning it into 'will'.
         """
         if self.__verbs_ending_non_ed is None:
-            self.__verbs_ending_non_ed = get_file_unique_lines(self.verbs_ending_non_ed_path)
+            self.__verbs_ending_non_ed = self.__snapshot.get(self.verbs_ending_non_ed_path, get_file_unique_lines)
         return self.__verbs_ending_non_ed
 
+    @property
+    def reviewed_pairs(self) -> dict:
+        """ Get the map of reviewed transformations from original words to their base forms.
+
+        The user copies correct transformations from `parsed_pairs.txt` to `reviewed_pairs.txt`.
+        Reviewed words are transformed by this map before any rule is applied.
+        For instance, the reviewed pair 'ran - run' is applied to the word 'ran' without any rule.
+        """
+        if self.__reviewed_pairs is None:
+            self.__reviewed_pairs = self.__snapshot.get(self.reviewed_pairs_path, get_reviewed_pairs)
+        return self.__reviewed_pairs
+
     @property
     def verbs_v3(self) -> dict:
         """ Get the map of irregular verbs mapping V3 to V1. """
         if self.__v3 is None:
-            self.__v3 = get_v3(self.irregular_verbs_path)
+            table = self.__snapshot.get(self.irregular_verbs_path, get_v_table)
+            self.__v3 = get_v3(self.irregular_verbs_path, table=table)
         return self.__v3
 
     @property
     def verbs_v2(self) -> dict:
         """ Get the map of irregular verbs mapping V2 to V1. """
         if self.__v2 is None:
-            self.__v2 = get_v2(self.irregular_verbs_path)
+            table = self.__snapshot.get(self.irregular_verbs_path, get_v_table)
+            self.__v2 = get_v2(self.irregular_verbs_path, table=table)
         return self.__v2
 
     @property
     def verbs_v1(self) -> dict:
         """ Get the map of irregular verbs mapping V1 to V1. """
         if self.__v1 is None:
-            self.__v1 = get_v1(self.irregular_verbs_path)
+            table = self.__snapshot.get(self.irregular_verbs_path, get_v_table)
+            self.__v1 = get_v1(self.irregular_verbs_path, table=table)
         return self.__v1
 
+    def load_lists(self) -> None:
+        """ Load all reference lists and update the compiled snapshot if any list has changed. """
+        self.only_ending_ed
+        self.verbs_ending_e
+        self.verbs_ending_non_ed
+        self.verbs_v3
+        self.verbs_v2
+        self.verbs_v1
+        self.reviewed_pairs
+        self.__snapshot.save()
+
     def __str__(self):
         """ Return the string representation of the object. """
         cur_set = (
@@ -201,6 +228,7 @@ class InfinitAttrib:
         f"  verbs_ending_e_path = {self.verbs_ending_e_path}\n"
         f"  verbs_ending_non_ed_path = {self.verbs_ending_non_ed_path}\n"
         f"  reviewed_pairs_path = {self.reviewed_pairs_path}\n"
+        f"  snapshot_path = {self.snapshot_path}\n"
         f"  parsed_pairs_path = {self.parsed_pairs_path}\n"
         f"  unreviewed_pairs_path = {self.unreviewed_pairs_path}\n")
         return cur_set
@@ -214,6 +242,7 @@ class InfinitAttrib:
         f"{str(self.verbs_ending_e_path.resolve())}\n"
         f"{str(self.verbs_ending_non_ed_path.resolve())}\n"
         f"{str(self.reviewed_pairs_path.resolve())}\n"
+        f"{str(self.snapshot_path.resolve())}\n"
         f"{str(self.parsed_pairs_path.resolve())}\n"
         f"{str(self.unreviewed_pairs_path.resolve())}\n"
         )
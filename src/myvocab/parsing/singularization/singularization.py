@@ -3,6 +3,9 @@ from src.myvocab.parsing.singularization.data import path_file
 from src.myvocab.parsing.commands.get_file_unique_lines import get_file_unique_lines
 from src.myvocab.parsing.commands.save_file import save_file
 from src.myvocab.parsing.commands.get_v_tuple import get_v2
+from src.myvocab.parsing.commands.get_v_table import get_v_table
+from src.myvocab.parsing.commands.get_reviewed_pairs import get_reviewed_pairs
+from src.myvocab.utils.snapshot_handler.reference_snapshot import ReferenceSnapshot
 
 class SingularAttrib:
     """ Singular transformation configuration.
@@ -23,6 +26,7 @@ class SingularAttrib:
         """
         self.__dir_unique_id = dir_unique_id
         self.initialize()
+        self.__snapshot = ReferenceSnapshot(self.snapshot_path)
 
     # Singularization 
     __home = Path.home()
@@ -35,6 +39,11 @@ class SingularAttrib:
         else:
             return Path.joinpath(self.__home, self.__dir_unique_id, "Singularization")
 
+    @property
+    def snapshot_path(self):
+        """ Get /Documents/Singularization/reference_lists.pickle directory. """
+        return Path.joinpath(self.singularization_path, "reference_lists.pickle")
+
     # Singularization in
     @property
     def singularization_in_path(self):
@@ -93,7 +102,7 @@ class SingularAttrib:
         For example, the 'invariable -s endings' rule correctly excludes the adverb 'across' from processing.
         """
         if self.__only_ending_s is None:
-            self.__only_ending_s = get_file_unique_lines(self.only_ending_s_path)
+            self.__only_ending_s = self.__snapshot.get(self.only_ending_s_path, get_file_unique_lines)
         return self.__only_ending_s
 
     @property
@@ -105,7 +114,7 @@ class SingularAttrib:
         and intended for informational purposes only, rather than for controlling processing logic.
         """
         if self.__singular_ending_non_s is None:
-            self.__singular_ending_non_s = get_file_unique_lines(self.singular_ending_non_s_path)
+            self.__singular_ending_non_s = self.__snapshot.get(self.singular_ending_non_s_path, get_file_unique_lines)
         return self.__singular_ending_non_s
 
     @property
@@ -116,9 +125,30 @@ class SingularAttrib:
         For instance, the irregular nouns mapping correctly handles the plural 'feet' by converting it to the singular 'foot'.
         """
         if self.__irregular_plural_nouns is None:
-            self.__irregular_plural_nouns = get_v2(self.irregular_plural_nouns_path)
+            table = self.__snapshot.get(self.irregular_plural_nouns_path, get_v_table)
+            self.__irregular_plural_nouns = get_v2(self.irregular_plural_nouns_path, table=table)
         return self.__irregular_plural_nouns
 
+    @property
+    def reviewed_pairs(self) -> dict:
+        """ Get the map of reviewed transformations from original words to their base forms.
+
+        The user copies correct transformations from `parsed_pairs.txt` to `reviewed_pairs.txt`.
+        Reviewed words are transformed by this map before any rule is applied.
+        For instance, the reviewed pair 'lives - life' is applied to the word 'lives' without any rule.
+        """
+        if self.__reviewed_pairs is None:
+            self.__reviewed_pairs = self.__snapshot.get(self.reviewed_pairs_path, get_reviewed_pairs)
+        return self.__reviewed_pairs
+
+    def load_lists(self) -> None:
+        """ Load all reference lists and update the compiled snapshot if any list has changed. """
+        self.only_ending_s
+        self.singular_ending_non_s
+        self.irregular_plural_nouns
+        self.reviewed_pairs
+        self.__snapshot.save()
+
     def __str__(self) -> str:
         """ Return the string representation of the object. """
         cur_str = (
@@ -128,6 +158,7 @@ class SingularAttrib:
         f"  singular_ending_non_s_path = {self.singular_ending_non_s_path}\n"
         f"  irregular_plural_nouns_path = {self.irregular_plural_nouns_path}\n"
         f"  reviewed_pairs_path = {self.reviewed_pairs_path}\n"
+        f"  snapshot_path = {self.snapshot_path}\n"
         f"  parsed_pairs_path = {self.parsed_pairs_path}\n"
         f"  unreviewed_pairs_path = {self.unreviewed_pairs_path}\n")
         return cur_str
@@ -140,6 +171,7 @@ class SingularAttrib:
         f"{str(self.singular_ending_non_s_path.resolve())}\n"
         f"{str(self.irregular_plural_nouns_path.resolve())}\n"
         f"{str(self.reviewed_pairs_path.resolve())}\n"
+        f"{str(self.snapshot_path.resolve())}\n"
         f"{str(self.parsed_pairs_path.resolve())}\n"
         f"{str(self.unreviewed_pairs_path.resolve())}\n"
         )
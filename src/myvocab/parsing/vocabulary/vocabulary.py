@@ -36,6 +36,10 @@ class VocabConfig:
     __ALL_PATCHES_FILE_NAME: str = "view_all_used_paths.txt"
     __TARGET_LANGUAGES_FILE_NAME: str = "supported_target_languages.txt"
     __LOG_FILE_NAME: str = "app.log"
+    __MANIFEST_FILE_NAME: str = "manifest.json"
+    __LEMMA_CACHE_FILE_NAME: str = "lemma_cache.sqlite3"
+    __TRANSLATION_CACHE_FILE_NAME: str = "translation_cache.sqlite3"
+    __IAM_TOKEN_FILE_NAME: str = "iam_token.json"
 
     __result_file_name: str = "vocabulary.txt"
     __directories_file_name: str = "directories.txt"
@@ -43,6 +47,8 @@ class VocabConfig:
     __source_language: str = "English"
     __target_language_code: str = "ru"
     __target_language: str = "русский"
+    # Target language codes and names; the vocabulary is translated into each of them
+    __target_languages: tuple = (("ru", "русский"),)
 
     # Flag to enable singular transformation
     use_lemma_singular: bool = True
@@ -54,6 +60,21 @@ class VocabConfig:
     use_order_text: bool = True
     # Flag to enable processing files and folders starting with "!"
     use_folder_with_leading_exclamation_mark: bool = False
+    # Flag to enable reparsing only new or changed files
+    use_file_manifest: bool = True
+    # Maximum number of cached word transformations (0 - the cache is disabled)
+    lemma_cache_size: int = 200_000
+    # Number of worker processes for parsing files (1 - serial parsing, 0 - all CPU cores)
+    parse_workers: int = 1
+    # Flag to enable reusing translations of the previous runs
+    use_translation_cache: bool = True
+    # Maximum number of translation requests in flight
+    translate_workers: int = 4
+    # Flag to enable keeping the IAM token between runs.
+    # The token is written to the result directory inside the base directory, which may be synced or shared
+    use_iam_token_cache: bool = False
+    # Number of days the supported languages file is up to date (0 - it is fetched again on every run)
+    languages_ttl_days: int = 30
 
     @property
     def dir_unique_id(self):
@@ -85,6 +106,15 @@ class VocabConfig:
         """ Set the name of the result vocabulary file. """
         self.__result_file_name = result_file_name
 
+    def get_result_file(self, target_language_code: str = None):
+        """ Get the path to the result vocabulary file of the target language.
+
+        With several target languages, the code is appended to the file name, e.g. `vocabulary_de.txt`.
+        """
+        if target_language_code is None or len(self.target_languages) < 2:
+            return self.result_file
+        return self.result_file.with_name(f"{self.result_file.stem}_{target_language_code}{self.result_file.suffix}")
+
     @property
     def directories_file(self):
         """ Get the path to the file representing the full directory tree during file parsing. """
@@ -107,23 +137,24 @@ class VocabConfig:
 
     @property
     def target_language_code(self):
-        """ Get the target language. """
+        """ Get the main target language code; it is set with `target_languages`. """
         return self.__target_language_code
 
-    @target_language_code.setter
-    def target_language_code(self, target_language_code):
-        """ Set the target language. """
-        self.__target_language_code = target_language_code
-
     @property
     def target_language(self):
-        """ Get the target language. """
+        """ Get the main target language; it is set with `target_languages`. """
         return self.__target_language
 
-    @target_language.setter
-    def target_language(self, target_language):
-        """ Set the target language. """
-        self.__target_language = target_language
+    @property
+    def target_languages(self) -> tuple:
+        """ Get the target language codes and names. """
+        return self.__target_languages
+
+    @target_languages.setter
+    def target_languages(self, target_languages: tuple):
+        """ Set the target language codes and names; the first one is the main target language. """
+        self.__target_languages = tuple(target_languages)
+        self.__target_language_code, self.__target_language = self.__target_languages[0]
 
     @property
     def settings_file(self):
@@ -140,6 +171,26 @@ class VocabConfig:
         """ Get the path to the supported languages file. """
         return Path.joinpath(self.result_directory, self.__TARGET_LANGUAGES_FILE_NAME)
 
+    @property
+    def manifest_file(self):
+        """ Get the path to the per-file manifest of parsed files. """
+        return Path.joinpath(self.result_directory, self.__MANIFEST_FILE_NAME)
+
+    @property
+    def lemma_cache_file(self):
+        """ Get the path to the persistent cache of word transformations. """
+        return Path.joinpath(self.result_directory, self.__LEMMA_CACHE_FILE_NAME)
+
+    @property
+    def translation_cache_file(self):
+        """ Get the path to the persistent cache of translations. """
+        return Path.joinpath(self.result_directory, self.__TRANSLATION_CACHE_FILE_NAME)
+
+    @property
+    def iam_token_file(self):
+        """ Get the path to the IAM token kept between runs. """
+        return Path.joinpath(self.result_directory, self.__IAM_TOKEN_FILE_NAME)
+
     @property
     def singular(self):
         """ Get the Singular transformation configuration. """
@@ -183,12 +234,23 @@ class VocabConfig:
         f"all_patches_file = {self.all_patches_file}\n"
         f"target_languages_file = {self.target_languages_file}\n"
         f"log_file = {self.log_file}\n"
+        f"manifest_file = {self.manifest_file}\n"
+        f"lemma_cache_file = {self.lemma_cache_file}\n"
+        f"translation_cache_file = {self.translation_cache_file}\n"
+        f"iam_token_file = {self.iam_token_file}\n"
         f"use_lemma_singular = {self.use_lemma_singular}\n"
         f"use_lemma_infinit = {self.use_lemma_infinit}\n"
         f"use_word_translate = {self.use_word_translate}\n"
-        f"target_language = {self.target_language}\n"
+        f"target_languages = {", ".join(name for code, name in self.target_languages)}\n"
         f"use_order_text = {self.use_order_text}\n"
         f"use_folder_with_leading_exclamation_mark = {self.use_folder_with_leading_exclamation_mark}\n"
+        f"use_file_manifest = {self.use_file_manifest}\n"
+        f"lemma_cache_size = {self.lemma_cache_size}\n"
+        f"parse_workers = {self.parse_workers}\n"
+        f"use_translation_cache = {self.use_translation_cache}\n"
+        f"translate_workers = {self.translate_workers}\n"
+        f"use_iam_token_cache = {self.use_iam_token_cache}\n"
+        f"languages_ttl_days = {self.languages_ttl_days}\n"
         f"{"" if self.singular is None else f"{self.singular}"}"
         f"{"" if self.infinit is None else f"{self.infinit}"}"
         f"{'-'*40}\n"
@@ -205,6 +267,10 @@ class VocabConfig:
         f"{str(self.all_patches_file.resolve())}\n"
         f"{str(self.target_languages_file.resolve())}\n"
         f"{str(self.log_file.resolve())}\n"
+        f"{str(self.manifest_file.resolve())}\n"
+        f"{str(self.lemma_cache_file.resolve())}\n"
+        f"{str(self.translation_cache_file.resolve())}\n"
+        f"{str(self.iam_token_file.resolve())}\n"
         f"{"" if self.singular is None else f"{self.singular.str_path()}"}"
         f"{"" if self.infinit is None else f"{self.infinit.str_path()}"}"
         )
@@ -1,67 +1,28 @@
 import logging
 import os
-import re
 from pathlib import Path
 from src.myvocab.parsing.vocabulary import vocabulary as vcb
 from src.myvocab.parsing.commands.load_settings import load_settings
 from src.myvocab.parsing.commands.write_settings import write_settings
 from src.myvocab.parsing.commands.write_all_patches import write_all_patches
 from src.myvocab.parsing.commands.write_directories import write_directories
-from src.myvocab.parsing.commands.get_singular import get_singular
-from src.myvocab.parsing.commands.get_infinit import get_infinit
+from src.myvocab.parsing.commands.discover_directories import discover_directories
+from src.myvocab.parsing.commands.parse_files import parse_files
 from src.myvocab.parsing.commands.save_file import save_file
-from src.myvocab.parsing.commands.diff_two_files import diff_two_files
-from src.myvocab.parsing.commands.get_init_data import get_init_data
-from src.myvocab.parsing.commands.skip_current_dir import skip_current_dir
-from src.myvocab.utils.walk_handler.handle_error import handle_error
-from src.myvocab.validators import validators as vld
-from src.myvocab.exceptions import exceptions as exc
-from src.myvocab.constants import constants as cns
+from src.myvocab.parsing.commands.load_manifest import load_manifest
+from src.myvocab.parsing.commands.save_manifest import save_manifest
+from src.myvocab.parsing.commands.get_file_state import get_file_state
+from src.myvocab.parsing.commands.load_lemma_cache import load_lemma_cache
+from src.myvocab.parsing.commands.save_lemma_cache import save_lemma_cache
+from src.myvocab.parsing.commands.load_translation_cache import load_translation_cache
+from src.myvocab.parsing.commands.save_translation_cache import save_translation_cache
+from src.myvocab.parsing.commands.get_reference_fingerprint import get_reference_fingerprint
+from src.myvocab.utils.sort_handler.external_sort import ExternalSort
+from src.myvocab.parsing.commands.diff_sorted_files import diff_sorted_files
 from src.myvocab.parsing.infinitive import infinitive as inf
-from src.myvocab.translation.translator import translate
-from src.myvocab.authentication.auth_yandex.function_iam.fetch_iam_func import fetch_iam_func
-from src.myvocab.authentication.auth_yandex.account_iam.fetch_iam_oauth import fetch_iam_oauth
-# from src.myvocab.authentication.auth_yandex.exchange_jwt_iam.create_iam_token import create_iam_token
 
 logger = logging.getLogger(__name__)
 
-def add_pair(payload: dict, pairs: dict) -> None:
-   """ Store the word pair based on the transformer ID. """
-
-   if payload["pair"] != "":
-      if payload["id"] in cns.RANGE_SINGULAR_ID:
-         pairs["singular"].add(payload["pair"])
-      elif payload["id"] in cns.RANGE_INFINIT_ID:
-         pairs["infinit"].add(payload["pair"])
-
-def set_transformer (word: str, vocab: vcb.VocabConfig) -> dict:
-   """ Process a word through the first fitted transformer. """
-
-   vdata = get_init_data(word)
-
-   # Singular-transformer
-   if vocab.use_lemma_singular:
-      # Skip singularizing verbs ending in -s
-      if word not in vocab.verbs_ending_s:
-         vdata = get_singular(word, vocab)
-         if vdata["id"] != cns.UNCHANGED_DATA_ID:
-            return vdata
-
-   # Infinite-transformer
-   if vocab.use_lemma_infinit:
-      vdata = get_infinit(word, vocab)
-      if vdata["id"] != cns.UNCHANGED_DATA_ID:
-         return vdata
-
-   return vdata
-
-def remove_translation_marks(items: list) -> list:
-   return_items = list(items)
-   for index, item in enumerate(items):
-      if find_list := re.findall(f'{cns.TAG_TRANSLATE}(.+)', item):
-         return_items[index] = find_list[0]
-   return return_items
-
 def render_vocab(base_path: Path):
    """ Generate a vocabulary from the base directory.
 
@@ -76,12 +37,17 @@ def render_vocab(base_path: Path):
    vocab = vcb.VocabConfig(base_path)
    # Load settings from an existing file, otherwise persist defaults
    load_settings(vocab)
+   # An IAM token kept by a previous run is not left on disk once keeping it is disabled
+   if not vocab.use_iam_token_cache:
+      vocab.iam_token_file.unlink(missing_ok=True)
 
-   # Add transformers
+   # Add transformers with their reference lists loaded from the compiled snapshot
    if vocab.use_lemma_singular:
       vocab.set_singular()
+      vocab.singular.load_lists()
    if vocab.use_lemma_infinit:
       vocab.set_infinitive()
+      vocab.infinit.load_lists()
 
    # Get the list of verbs ending in -s
    verbs_s = set()
@@ -99,7 +65,10 @@ def render_vocab(base_path: Path):
    write_settings(vocab)
 
    write_all_patches(vocab)
-   write_directories(vocab)
+
+   # Traverse the directory tree once for the directory tree and the file parsing
+   directories = discover_directories(vocab)
+   write_directories(vocab, directories)
 
    parsed_pairs = {
       "singular": set(),
@@ -107,245 +76,200 @@ def render_vocab(base_path: Path):
    }
 
    lines_list = list()
-   lines_set = set()
-
-   # Caching transformations for reuse
-   transform_dict = dict()
-   # Caching translations for reuse
-   translated_words = dict()
+   # Indices of the words to translate in `lines_list`
+   words_list = list()
+   # Unique lines sorted within the memory budget
+   lines_sort = ExternalSort(vocab.result_directory)
+   # Unique words to translate of the ordered vocabulary, sorted apart from the raw lines
+   words_sort = ExternalSort(vocab.result_directory)
 
-   trn_tag = ""
    if vocab.use_word_translate:
-      # Tag for translation
-      trn_tag = cns.TAG_TRANSLATE
-      logger.info(f"Translation direction: " +
-                  f"`{vocab.source_language}` to `{vocab.target_language}` " +
-                  f"(`{vocab.source_language_code}` -> `{vocab.target_language_code}`)")
+      for target_language_code, target_language in vocab.target_languages:
+         logger.info(f"Translation direction: " +
+                     f"`{vocab.source_language}` to `{target_language}` " +
+                     f"(`{vocab.source_language_code}` -> `{target_language_code}`)")
 
    logger.info("Populating a new vocabulary with isolated words and phrases ...")
-   offset = len(vocab.base_directory.parts) - 1
-   # If the PyInstaller executable sets the base directory to '.'
-   if offset < 0:
-      offset = 0
+
+   # Text files to parse and their paths starting from the base directory
+   file_paths = list()
+   file_parts = list()
+   for dirpath, dirpath_parts, files in directories:
+      for filename in files:
+         file_paths.append(Path.joinpath(dirpath, filename))
+         file_parts.append(Path.joinpath(dirpath_parts, filename))
+
+   # Fingerprint of the reference word lists and transformer flags
+   reference_fingerprint = get_reference_fingerprint(vocab)
+   # The manifest is valid only for the same parsing rules and output mode
+   fingerprint = f"{reference_fingerprint}|{vocab.use_word_translate}|{vocab.use_order_text}"
+   old_manifest = load_manifest(vocab, fingerprint) if vocab.use_file_manifest else dict()
+   new_manifest = dict()
+
+   # Manifest keys, states and cached data of all files
+   file_keys = list()
+   file_states = list()
+   file_entries = list()
+   # New or changed files since the last run
+   changed_paths = list()
+   for file_path in file_paths:
+      key = file_path.relative_to(vocab.base_directory).as_posix()
+      state = None
+      entry = None
+      if vocab.use_file_manifest:
+         entry = old_manifest.get(key)
+         state = get_file_state(file_path, entry)
+         if entry and entry.get("hash") != state["hash"]:
+            entry = None
+      if entry is None:
+         changed_paths.append(file_path)
+      file_keys.append(key)
+      file_states.append(state)
+      file_entries.append(entry)
+
+   if vocab.use_file_manifest:
+      logger.info(f"Files to parse: {len(changed_paths)} of {len(file_paths)}")
 
    # Show the `activity indicator`
    print(f"Parsing files: ", end="", flush=True)
 
    flag_next_file = False
 
-   # Path.walk traverses the directory tree, starting from the base
-   for dirpath, dirs, files in Path.walk(vocab.base_directory, on_error = handle_error):
-
-      # The path is starting from the base directory.
-      dirpath_parts = Path(*dirpath.parts[offset::])
-
-      # Check if the current directory should be ignored
-      if skip_current_dir(vocab, dirpath, dirpath_parts):
-         continue
-
-      for filename in files:
-
-         # Text files only
-         if not filename.endswith(".txt"):
-            continue
+   use_lemma = vocab.use_lemma_singular or vocab.use_lemma_infinit
+   # Word transformations of the previous runs
+   transform_dict = load_lemma_cache(vocab, reference_fingerprint) if use_lemma and changed_paths else dict()
+   # Word transformations used in this run
+   used_lemmas = dict()
 
-         try:
-            # Ignore files prefixed with '!' if 'use_folder_with_leading_exclamation_mark' flag is unset
-            join_path = Path.joinpath(dirpath_parts, filename)
-            vld.validate_directory_with_leading_exclamation_mark(join_path, vocab.use_folder_with_leading_exclamation_mark)
-         except exc.VocabError:
-            continue
+   # Files are parsed serially or in a process pool; the results keep the file order
+   parsed_data = parse_files(vocab, changed_paths, transform_dict)
 
-         filepath = Path.joinpath(dirpath, filename)
+   for key, state, entry, join_path in zip(file_keys, file_states, file_entries, file_parts):
 
+      if entry is not None:
+         # Reuse the parsed data of the unchanged file
+         file_data = entry
+      else:
          # Keep the `activity indicator` visible
          print(f".", end="", flush=True)
-
-         file_lines = list()
-         file_list = list()
-         file_set = set()
-
-         # Read the current file
-         with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Read lines from a file
-            file_lines = re.findall(r'[^\n]+', content)
-
-         t_word = False
-         if not vocab.use_order_text:
-
-            cur_str = str(Path.joinpath(dirpath_parts, filename)).ljust(80, '-')
-            if flag_next_file:
-               file_list.append(f"\n{cur_str}")
-            else:
-               flag_next_file = True
-               file_list.append(f"{cur_str}")
-
-         for file_line in file_lines:
-            if file_line == cns.TAG_WORD:
-               t_word = True
-               continue
-            elif file_line == cns.TAG_END_WORD:
-               t_word = False
-               continue
-
-            if t_word:
-               file_line_words = re.findall(r'\b[a-zA-Z0-9-]+\b', file_line.lower())
-
-               # Word list processing without using Transformers
-               if not (vocab.use_lemma_infinit or  vocab.use_lemma_singular):
-
-                  if vocab.use_order_text and not vocab.use_word_translate:
-                     file_set.update(file_line_words)
-                  elif vocab.use_order_text:
-                     for file_line_word in file_line_words:
-                        file_set.add(trn_tag + file_line_word)
-                  else:
-                     for file_line_word in file_line_words:
-                        if file_line_word not in file_set:
-                           file_list.append(trn_tag + file_line_word)
-                           file_set.add(file_line_word)
-
-               else:
-                  # Word processing using Transformers
-                  for word in file_line_words:
-                     # Exclude numbers
-                     if re.match(r'\b[0-9]+\b', word):
-                           continue
-                     # If the current word has already been processed
-                     if val := transform_dict.get(word):
-                        if vocab.use_order_text:
-                           file_set.add(trn_tag + val)
-                        else:
-                           if val not in file_set:
-                              file_list.append(trn_tag + val)
-                              file_set.add(val)
-                        continue
-
-                     # if the word contains a hyphen
-                     is_multi = False
-                     multi_words = re.split(r'-', word)
-                     if len(multi_words) > 1:
-                        for m_word in multi_words:
-                           if m_word != "":
-                              is_multi = True
-                              break
-                     # Hyphenated compound
-                     if is_multi:
-                        phrase = ""
-                        # data_list = list()
-                        for m_word in multi_words:
-                           if m_word != "":
-                              if phrase != "":
-                                 phrase += "-"
-                              # Hyphenated word ending in -s or -ed (e.g., passers-by; strong-willed)
-                              transform_data = set_transformer(m_word, vocab)
-                              # data_list.append(transform_data)
-                              phrase = phrase + transform_data["word"]
-                        if phrase != "":
-                           transform_dict[word] = phrase
-                           # Keep the resulting Hyphenated compounds and their parsing pair
-                           init_data = get_init_data(trn_tag + phrase)
-                           if phrase != word:
-                              init_data["pair"] = word + " - " + phrase
-                           add_pair(init_data, parsed_pairs)
-                           if vocab.use_order_text:
-                              file_set.add(trn_tag + phrase)
-                           else:
-                              if phrase not in file_set:
-                                 file_list.append(trn_tag + phrase)
-                                 file_set.add(phrase)
-                     else:
-                        transform_data = set_transformer(word, vocab)
-                        transform_word = transform_data["word"]
-                        transform_dict[word] = transform_word
-                        transform_data["word"] = trn_tag + transform_word
-                        add_pair(transform_data, parsed_pairs)
-                        if vocab.use_order_text:
-                           file_set.add(trn_tag + transform_word)
-                        else:
-                           if transform_word not in file_set:
-                              file_list.append(trn_tag + transform_word)
-                              file_set.add(transform_word)
-            else:
-               file_line = file_line.strip()
-               if file_line != '':
-                  if vocab.use_order_text:
-                     file_set.add(file_line)
-                  else:
-                     if file_line not in file_set:
-                        file_list.append(file_line)
-                        file_set.add(file_line)
-
-         if vocab.use_order_text:
-            lines_set.update(file_set)
+         file_data = next(parsed_data)
+         used_lemmas.update(file_data["lemmas"])
+
+      if vocab.use_file_manifest:
+         # Deleted files are dropped from the new manifest
+         new_manifest[key] = state | {
+            "lines": file_data["lines"],
+            "words": file_data["words"],
+            "pairs": {
+               "singular": list(file_data["pairs"]["singular"]),
+               "infinit": list(file_data["pairs"]["infinit"])
+            }
+         }
+
+      parsed_pairs["singular"].update(file_data["pairs"]["singular"])
+      parsed_pairs["infinit"].update(file_data["pairs"]["infinit"])
+
+      if vocab.use_order_text:
+         # The words follow the raw lines
+         first_word = len(file_data["lines"]) - len(file_data["words"])
+         lines_sort.update(file_data["lines"][:first_word])
+         words_sort.update(file_data["lines"][first_word:])
+      else:
+         cur_str = str(join_path).ljust(80, '-')
+         if flag_next_file:
+            lines_list.append(f"\n{cur_str}")
          else:
-            lines_list.extend(file_list)
-
-   if vocab.use_order_text:
-      all_list = list(lines_set)
+            flag_next_file = True
+            lines_list.append(f"{cur_str}")
+         words_list.extend(len(lines_list) + index for index in file_data["words"])
+         lines_list.extend(file_data["lines"])
+
+   # Shut down the worker processes
+   parsed_data.close()
+
+   if vocab.use_file_manifest:
+      save_manifest(vocab, fingerprint, new_manifest)
+   if use_lemma and changed_paths:
+      save_lemma_cache(vocab, reference_fingerprint, used_lemmas)
+
+   # The sorting option of the vocabulary file
+   is_sorted = vocab.use_order_text
+   if vocab.use_order_text and vocab.use_word_translate:
+      # Translation requires the whole list
+      all_list = list(lines_sort)
+      lines_sort.close()
+      # The words follow the raw lines; the vocabulary file is sorted after translation
+      first_word = len(all_list)
+      all_list.extend(words_sort)
+      words_sort.close()
+      words_list = range(first_word, len(all_list))
+   elif vocab.use_order_text:
+      # Sorted unique lines are streamed to the vocabulary file
+      all_list = lines_sort
+      is_sorted = False
    else:
-      all_list = list(lines_list)
+      all_list = lines_list
 
    # Restore word wrap after using the activity indicator
    print("")
 
-   if vocab.use_word_translate:
+   # Vocabulary per target language; without translation the single vocabulary file
+   vocabularies = {None: all_list}
 
-      auth = os.getenv('AUTH')
-      logger.info(f"auth: {auth}")
+   if vocab.use_word_translate:
 
-      if auth == 'account_iam':
-         # To get an IAM token with a Yandex account
-         vdata = fetch_iam_oauth()
-         if vdata.get("ok") and (iam_token := vdata.get("iamToken")):
-            transl_words = None if vocab.use_order_text else translated_words
-            all_list = translate(
-               iam=iam_token,
-               words=all_list,
-               target_language_code=vocab.target_language_code,
-               result_directory=vocab.result_file.parent,
-               translated_words=transl_words)
+      # The translation and authentication stack is imported only when translation is enabled
+      from src.myvocab.translation.translator import translate_languages
+      from src.myvocab.authentication.auth_yandex.iam_token_provider import get_token_provider
+
+      # Caching translations for reuse, per translation direction
+      translated_words = dict()
+      for target_language_code, target_language in vocab.target_languages:
+         if vocab.use_translation_cache:
+            # Translations of the previous runs; only the remaining words are sent for translation
+            translated_words[target_language_code] = load_translation_cache(vocab, all_list, words_list, target_language_code)
+         elif vocab.use_order_text:
+            # Words of the ordered vocabulary are unique, so caching is skipped
+            translated_words[target_language_code] = None
          else:
-            all_list = remove_translation_marks(all_list)
-            logger.error(f"Failed to fetch IAM token while preparing to translate.")
+            translated_words[target_language_code] = dict()
 
-      elif auth == 'exchange_jwt_iam':
-         # To get an IAM token with an Authorized keys.
-         try:
-            iam_token = create_iam_token()
-            transl_words = None if vocab.use_order_text else translated_words
-            all_list = translate(
-               iam=iam_token,
-               words=all_list,
-               target_language_code=vocab.target_language_code,
-               result_directory=vocab.result_file.parent,
-               translated_words=transl_words)
-         except Exception as e:
-            all_list = remove_translation_marks(all_list)
-            logger.error(f"Failed to fetch IAM token while preparing to translate: {e}")
+      auth = os.getenv('AUTH')
+      logger.info(f"auth: {auth}")
 
-      else:
-         # To get an IAM token from the function code in Yandex Cloud Functions
-         vdata = fetch_iam_func()
-         if iam_token := vdata.get("access_token"):
-            transl_words = None if vocab.use_order_text else translated_words
-            all_list = translate(
+      # The IAM token is shared with the language validation and reused by the next runs
+      token_provider = get_token_provider()
+      token_provider.cache_file = vocab.iam_token_file if vocab.use_iam_token_cache else None
+      try:
+         if iam_token := token_provider.get_token():
+            # Words are parsed once and translated into all target languages through one pool of requests
+            vocabularies = translate_languages(
                iam=iam_token,
                words=all_list,
-               target_language_code=vocab.target_language_code,
+               word_indices=words_list,
+               translated_words=translated_words,
                result_directory=vocab.result_file.parent,
-               translated_words=transl_words)
+               max_workers=vocab.translate_workers,
+               token_provider=token_provider)
          else:
-            all_list = remove_translation_marks(all_list)
+            vocabularies = dict.fromkeys(translated_words, all_list)
             logger.error(f"Failed to fetch IAM token while preparing to translate.")
-
-   # Vocabulary
-   if not vocab.result_file.is_file():
-      vocab.result_file.parent.mkdir(exist_ok = True, parents = True)
-   # Write the vocabulary to a file
-   save_file(vocab.result_file, all_list, vocab.use_order_text)
-   logger.info(f"The resulting vocabulary has been created: \n{vocab.result_file.resolve()}")
+      finally:
+         # The translations received so far are kept even if the translation is interrupted (Ctrl+C);
+         # the vocabulary files are not written then
+         if vocab.use_translation_cache:
+            for target_language_code, cur_translated_words in translated_words.items():
+               save_translation_cache(vocab, cur_translated_words, target_language_code)
+
+   for target_language_code, cur_list in vocabularies.items():
+      result_file = vocab.get_result_file(target_language_code)
+      # Vocabulary
+      if not result_file.is_file():
+         result_file.parent.mkdir(exist_ok = True, parents = True)
+      # Write the vocabulary to a file
+      save_file(result_file, cur_list, is_sorted)
+      logger.info(f"The resulting vocabulary has been created: \n{result_file.resolve()}")
+   lines_sort.close()
 
    # Singularization
    if vocab.use_lemma_singular:
@@ -356,9 +280,13 @@ def render_vocab(base_path: Path):
       # Some or all transformations validated by the user may be copied to the `singular.reviewed_pairs_path` directory.
 
       # Get the remaining unverified transformation.
-      unreviewed_pairs = diff_two_files(vocab.singular.parsed_pairs_path, vocab.singular.reviewed_pairs_path)
+      counts = dict()
+      # The pairs are merged as sorted streams in any mode: the memory does not grow with the size of the files
+      unreviewed_pairs = diff_sorted_files(vocab.singular.parsed_pairs_path, vocab.singular.reviewed_pairs_path,
+                                           vocab.result_directory, counts)
       # Write the remaining unverified transformation to the `singular.unreviewed_pairs_path` directory.
-      save_file(vocab.singular.unreviewed_pairs_path, unreviewed_pairs, vocab.use_order_text)
+      save_file(vocab.singular.unreviewed_pairs_path, unreviewed_pairs, False)
+      logger.info(f"Singular pairs: {counts['added']} unreviewed, {counts['removed']} reviewed but not parsed in this run")
 
    # Infinitive
    if vocab.use_lemma_infinit:
@@ -369,6 +297,10 @@ def render_vocab(base_path: Path):
       # Some or all transformations validated by the user may be copied to the `infinit.reviewed_pairs_path` directory.
 
       # Get the remaining unverified transformation.
-      unreviewed_pairs = diff_two_files(vocab.infinit.parsed_pairs_path, vocab.infinit.reviewed_pairs_path)
+      counts = dict()
+      # The pairs are merged as sorted streams in any mode: the memory does not grow with the size of the files
+      unreviewed_pairs = diff_sorted_files(vocab.infinit.parsed_pairs_path, vocab.infinit.reviewed_pairs_path,
+                                           vocab.result_directory, counts)
       # Write the remaining unverified transformation to the `infinit.unreviewed_pairs_path` directory.
-      save_file(vocab.infinit.unreviewed_pairs_path, unreviewed_pairs, vocab.use_order_text)
\ No newline at end of file
+      save_file(vocab.infinit.unreviewed_pairs_path, unreviewed_pairs, False)
+      logger.info(f"Infinitive pairs: {counts['added']} unreviewed, {counts['removed']} reviewed but not parsed in this run")
\ No newline at end of file
@@ -0,0 +1 @@
+"""  This is an empty file used only to locate a file directory path. """
\ No newline at end of file
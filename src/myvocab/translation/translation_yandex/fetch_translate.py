@@ -1,6 +1,7 @@
 import logging
 from src.myvocab.utils.fetche_handler.fetcher import fetch
 from src.myvocab.constants import constants as cns
+from src.myvocab.utils.env_handler.get_uri import get_uri
 
 logger = logging.getLogger(__name__)
 
@@ -20,4 +21,4 @@ def fetch_translate(iam: str, words: list, target_language_code: str) -> dict:
         "texts": words
     }
 
-    return fetch(cns.URI_TRANSLATE, headers=headers, payload=payload)
\ No newline at end of file
+    return fetch(get_uri('URI_TRANSLATE'), headers=headers, payload=payload)
\ No newline at end of file
@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from pathlib import Path
+from src.myvocab.exceptions import exceptions as exc
+from src.myvocab.parsing.commands.save_file import save_file
+from src.myvocab.translation.translation_yandex.data import path_file
+
+logger = logging.getLogger(__name__)
+
+
+def read_languages(languages_file: Path) -> dict:
+    """ Read the `code: name` lines of a supported languages file into a code -> name dict. """
+    languages = dict()
+    with open(file=languages_file, mode="r", encoding='utf-8') as f:
+        for line in f:
+            code, sep, name = line.partition(':')
+            if sep and code.strip() and name.strip():
+                languages[code.strip()] = name.strip()
+    return languages
+
+
+class LanguageCatalogue:
+    """ Supported target languages.
+
+    The supported languages file is read once into a code -> name dict.
+    Without the file, the snapshot shipped with the application is used, so a lookup never waits for the network.
+    A stale or missing file is fetched again in the background and is used by the next lookups and runs.
+    """
+
+    # Snapshot of the supported languages shipped with the application
+    __fallback_file: Path = Path.joinpath(Path(path_file.__file__).parent, "supported_target_languages.txt")
+
+    def __init__(self, languages_file: Path, ttl_days: int = 30):
+        """ Initialize the catalogue.
+        Args:
+            languages_file (Path): Supported languages file.
+            ttl_days (int): Number of days the file is up to date (0 - it is fetched again on every run).
+        """
+        self.__languages_file = languages_file
+        self.ttl_days = ttl_days
+        self.__languages = None
+        # Time of the fetch in seconds since the epoch; None for the shipped snapshot
+        self.__fetched_at = None
+        self.__lock = threading.Lock()
+        self.__refresh_thread = None
+
+    @property
+    def languages(self) -> dict:
+        """ Get the code -> name dict of the supported languages. """
+        with self.__lock:
+            if self.__languages is None:
+                self.__load()
+            return self.__languages
+
+    @property
+    def fetched_at(self) -> float | None:
+        """ Get the time the languages were fetched, None for the shipped snapshot. """
+        with self.__lock:
+            if self.__languages is None:
+                self.__load()
+            return self.__fetched_at
+
+    @property
+    def is_stale(self) -> bool:
+        """ Check whether the languages need to be fetched again. """
+        fetched_at = self.fetched_at
+        return fetched_at is None or time.time() - fetched_at >= self.ttl_days * 86400
+
+    def find(self, target_language_code: str) -> tuple:
+        """ Find the target language code.
+
+        Returns:
+            tuple: Target language code and name, empty if the code is not supported.
+        """
+        if (name := self.languages.get(target_language_code)) is not None:
+            return target_language_code, name
+        return ()
+
+    def refresh(self) -> None:
+        """ Fetch the supported languages and write them to the supported languages file. """
+
+        # The network stack is imported only when the languages are fetched
+        from src.myvocab.authentication.auth_yandex.iam_token_provider import get_token_provider
+        from src.myvocab.translation.translation_yandex.supported_languages import fetch_languages, get_languages_list
+
+        if not (iam_token := get_token_provider().get_token()):
+            raise exc.FetchIAMtokenError("during the supported languages refresh.")
+        fetch_langs = fetch_languages(iam_token)
+        if not fetch_langs["ok"]:
+            raise exc.FetchSupportedLanguagesError("")
+        langs = get_languages_list(fetch_langs)
+
+        # Replace the file atomically, so an interrupted refresh leaves the previous one intact
+        temp_file = self.__languages_file.with_name(self.__languages_file.name + ".tmp")
+        save_file(file_path=temp_file, items=langs, is_sorted=False)
+        temp_file.replace(self.__languages_file)
+
+        languages = read_languages(self.__languages_file)
+        with self.__lock:
+            self.__languages = languages
+            self.__fetched_at = time.time()
+
+    def refresh_in_background(self) -> threading.Thread:
+        """ Start refreshing the supported languages in a background thread, once per catalogue. """
+        with self.__lock:
+            if self.__refresh_thread is None:
+                self.__refresh_thread = threading.Thread(target=self.__refresh_logged, name="refresh-languages", daemon=True)
+                self.__refresh_thread.start()
+            return self.__refresh_thread
+
+    def __refresh_logged(self) -> None:
+        try:
+            self.refresh()
+            logger.info(f"The supported languages have been updated: {self.__languages_file}")
+        except Exception as e:
+            logger.warning(f"Failed to update the supported languages: {type(e)} {e}")
+
+    def __load(self) -> None:
+        """ Read the supported languages file, otherwise the shipped snapshot. """
+        if self.__languages_file.is_file():
+            try:
+                self.__languages = read_languages(self.__languages_file)
+                self.__fetched_at = self.__languages_file.stat().st_mtime
+                return
+            except (OSError, UnicodeError) as e:
+                logger.warning(f"Failed to read file: {self.__languages_file}: {type(e)} {e}")
+        self.__languages = read_languages(self.__fallback_file)
+        self.__fetched_at = None
+
+
+# Catalogues by the supported languages file, shared by all callers
+_catalogues = dict()
+_catalogues_lock = threading.Lock()
+
+def get_language_catalogue(languages_file: Path) -> LanguageCatalogue:
+    """ Get the catalogue of the supported languages file, shared by all callers. """
+    key = languages_file.resolve()
+    with _catalogues_lock:
+        if (catalogue := _catalogues.get(key)) is None:
+            catalogue = LanguageCatalogue(languages_file)
+            _catalogues[key] = catalogue
+        return catalogue
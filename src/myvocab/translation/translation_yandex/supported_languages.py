@@ -1,8 +1,7 @@
 import logging
-import re
 from pathlib import Path
-from src.myvocab.utils.fetche_handler.fetcher import fetch
 from src.myvocab.constants import constants as cns
+from src.myvocab.utils.env_handler.get_uri import get_uri
 
 logger = logging.getLogger(__name__)
 
@@ -16,18 +15,16 @@ def get_languages_list(fetch_langs: dict) -> list:
 
 def find_target_language_code(target_language_code: str, target_languages_file: Path) -> tuple:
     """ Find target language code in the supported languages file. """
-    lang = ()
-    if not target_languages_file.exists():
-        return lang
-    with open(file=target_languages_file, mode="r", encoding='utf-8') as f:
-        content = f.read()
-        if find_lang := re.findall(fr'({target_language_code}): *(.+)\n*', content):
-            return find_lang[0]
-    return lang
+    # The catalogue reads the file once for all lookups
+    from src.myvocab.translation.translation_yandex.language_catalogue import get_language_catalogue
+    return get_language_catalogue(target_languages_file).find(target_language_code)
 
 def fetch_languages(iam: str) -> dict:
     """ Fetching supported languages. """
 
+    # The network stack is imported only when the languages are fetched
+    from src.myvocab.utils.fetche_handler.fetcher import fetch
+
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {iam}"
@@ -37,4 +34,4 @@ def fetch_languages(iam: str) -> dict:
         "folderId": cns.FOLDER_ID
     }
 
-    return fetch(cns.URI_LANGUAGES, headers=headers, payload=payload)
\ No newline at end of file
+    return fetch(get_uri('URI_LANGUAGES'), headers=headers, payload=payload)
\ No newline at end of file
@@ -1,5 +1,11 @@
+import hashlib
+import json
 import logging
+import queue
 import re
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
 from pathlib import Path
 from src.myvocab.constants import constants as cns
 from src.myvocab.exceptions import exceptions as exc
@@ -12,176 +18,373 @@ logger = logging.getLogger(__name__)
 def format_word(num: int, word: str) -> str:
     return '@' + str(num) + '@ ' + word + ' @'
 
-def translate(iam: str, words: list, target_language_code: str, result_directory: Path, translated_words: dict = None,
-              is_wrap_ids: bool = False) -> list:
+def build_chunks(words: list, word_indices: Iterable = None, translated_words: dict = None, is_wrap_ids: bool = False) -> tuple:
     """
-    Fetch translations for a list of words through an API.
+    Split the words to translate into chunks of up to `TRANSLATE_CHUNK_SIZE` characters.
+
+    Only the entries of `word_indices` are visited, in one pass; the other lines are copied as is.
+
     Args:
-        iam (str): An IAM token is a unique sequence of characters issued to a user after authentication.
-        words (list): The list of English words to be translated.
-        target_language_code (str): Target language code.
-        result_directory (Path): Target directory for translation files.
+        words (list): The list of vocabulary lines with the English words to be translated.
+        word_indices (Iterable): Indices of the words to translate in `words`. If None, every entry is a word.
         translated_words (dict): Caching translations for reuse. If None, caching is skipped as input words are assumed to be unique.
         is_wrap_ids (bool): Using an ID-tagged wrapper template to ensure reversible parsing: @d+@ word @.
     Returns:
-        list: The List of bilingual word pairs.
+        tuple: The list of lines (cached translations are already paired)
+            and the list of chunks to be sent for translation.
     """
 
     # Populate a new list based on the input
     return_words = list(words)
-    # Main index
-    main_index = 0
-    # Chunk number
-    chunk_num = 0
-
-    # Chunking for translation
-    while main_index < len(words):
-        start_index = main_index
-        # Chunk of the word list
-        chunk = list()
-        # Extra chunk
-        extra_chunk = list()
-        # Chunk index
-        chunk_index = 0
+    # Chunks ready to be sent
+    chunks = list()
+    # Caching used words: word -> list of all global indices of the word, shared with the chunk map
+    placed_words = dict()
 
+    def new_chunk() -> dict:
         # Map has two modes, depending on whether caching is used for translations:
         # 1: word -> list of all global indices of the word
         # 2: chunk index -> current global index of the word
-        chunk_map = dict()
-
-        chunk_num += 1
-        # Chunk size
-        chunk_size = 0
-        # Template-wrapped word, activated by `is_wrap_ids`
-        wrapped_word = ""
-
-        for item in words[start_index:]:
-            # If a translation attribute is found
-            if find_list := re.findall(f'{cns.TAG_TRANSLATE}(.+)', item):
-                # Get word to translate
-                word = find_list[0]
-                word_length = len(word)
-                # Caching used words
-                if translated_words is not None and (map_list := chunk_map.get(word)):
-                    map_list.append(main_index)
-                    return_words[main_index] = word
-                    main_index += 1
-                    continue
-                # Caching translations
-                elif translated_words is not None and (trns_word := translated_words.get(word)):
-                    return_words[main_index] = f"{word} - {trns_word}"
-                    main_index += 1
-                    continue
-                # Use the template wrapper component
-                elif is_wrap_ids:
-                    # Word wrapped in a template
-                    wrapped_word = format_word(chunk_index + 1, word)
-                    word_length = len(wrapped_word)
-                # Increase chunk size to a target size
-                if chunk_size + word_length <= cns.TRANSLATE_CHUNK_SIZE:
-                    chunk_size += word_length
-                    chunk_index += 1
-
-                    # Caching is used for translations
-                    if translated_words is not None:
-                        # 1: word -> list of all global indices of the word
-                        cur_list = list()
-                        cur_list.append(main_index)
-                        chunk_map[word] = cur_list
-                    else:
-                        # 2: chunk index -> current global index of the word
-                        chunk_map[chunk_index] = main_index
+        return {"num": len(chunks) + 1, "chunk": list(), "extra_chunk": list(), "chunk_map": dict(), "size": 0}
+
+    def get_word_length(cur_chunk: dict, word: str) -> int:
+        if is_wrap_ids:
+            # Word wrapped in a template
+            return len(format_word(len(cur_chunk["chunk"]) + 1, word))
+        return len(word)
+
+    if word_indices is None:
+        word_indices = range(len(words))
+
+    cur_chunk = new_chunk()
+    for main_index in word_indices:
+        # Get word to translate
+        word = words[main_index]
+        # Caching used words, the word is translated with its first chunk
+        if translated_words is not None and (map_list := placed_words.get(word)):
+            map_list.append(main_index)
+            continue
+        # Caching translations
+        elif translated_words is not None and (trns_word := translated_words.get(word)):
+            return_words[main_index] = f"{word} - {trns_word}"
+            continue
+
+        word_length = get_word_length(cur_chunk, word)
+        # The chunk is full, start the next one
+        if cur_chunk["size"] + word_length > cns.TRANSLATE_CHUNK_SIZE and cur_chunk["chunk"]:
+            chunks.append(cur_chunk)
+            cur_chunk = new_chunk()
+            word_length = get_word_length(cur_chunk, word)
+        # The chunk size is too small
+        if word_length > cns.TRANSLATE_CHUNK_SIZE:
+            raise exc.ChunkSizeSmallError(cns.TRANSLATE_CHUNK_SIZE, word_length)
+
+        cur_chunk["size"] += word_length
+        if translated_words is not None:
+            # 1: word -> list of all global indices of the word
+            cur_list = [main_index]
+            cur_chunk["chunk_map"][word] = cur_list
+            placed_words[word] = cur_list
+        else:
+            # 2: chunk index -> current global index of the word
+            cur_chunk["chunk_map"][len(cur_chunk["chunk"]) + 1] = main_index
+
+        # Append the word to the chunk list
+        if is_wrap_ids:
+            cur_chunk["chunk"].append(format_word(len(cur_chunk["chunk"]) + 1, word))
+            cur_chunk["extra_chunk"].append(word)
+        else:
+            cur_chunk["chunk"].append(word)
+
+    # Translation chunk list is ready
+    if cur_chunk["chunk"]:
+        chunks.append(cur_chunk)
+
+    return return_words, chunks
+
+def get_checkpoint_path(translate_path: Path, chunk: dict, target_language_code: str) -> Path:
+    """ Get the checkpoint file of a chunk; the name depends only on the chunk content and the target language. """
+    key = hashlib.sha256(json.dumps([target_language_code, chunk["chunk"]], ensure_ascii=False).encode('utf-8')).hexdigest()
+    return Path.joinpath(translate_path, cns.TRANSLATE_CHECKPOINT_FILE.format(target_language_code, key[:32]))
+
+def load_checkpoint(checkpoint_path: Path, chunk: dict, target_language_code: str) -> dict | None:
+    """ Load the translation data of a chunk translated by a previous run, None if there is no checkpoint. """
+    if not checkpoint_path.is_file():
+        return None
+    try:
+        checkpoint = json.loads(checkpoint_path.read_text(encoding='utf-8'))
+        if checkpoint["target_language_code"] == target_language_code and checkpoint["chunk"] == chunk["chunk"]:
+            return checkpoint["fetch_data"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Failed to read file: {checkpoint_path}: {type(e)} {e}")
+    return None
+
+def save_checkpoint(checkpoint_path: Path, chunk: dict, target_language_code: str, fetch_data: dict) -> None:
+    """ Save the translation data of a chunk, so that a rerun does not send the chunk again. """
+    checkpoint = {"target_language_code": target_language_code, "chunk": chunk["chunk"], "fetch_data": fetch_data}
+    # Replace the file atomically, so an interrupted run does not leave a broken checkpoint
+    temp_file = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    try:
+        checkpoint_path.parent.mkdir(exist_ok=True, parents=True)
+        temp_file.write_text(json.dumps(checkpoint, ensure_ascii=False), encoding='utf-8')
+        temp_file.replace(checkpoint_path)
+    except Exception as e:
+        logger.exception(f"Failed to write file: {checkpoint_path}: {type(e)} {e}")
+
+def remove_checkpoints(translate_path: Path, target_language_code: str) -> None:
+    """ Remove the checkpoints of the target language once every chunk is translated. """
+    for checkpoint_path in translate_path.glob(cns.TRANSLATE_CHECKPOINT_FILE.format(target_language_code, "*")):
+        checkpoint_path.unlink(missing_ok=True)
+
+def fetch_chunk(iam: str, chunk: dict, target_language_code: str, result_directory: Path, token_provider=None) -> dict:
+    """
+    Send one chunk for translation.
+
+    A chunk translated by a previous run is restored from its checkpoint instead.
+    A successful response is saved as a checkpoint.
+
+    Args:
+        iam (str): An IAM token.
+        chunk (dict): A chunk built by `build_chunks`.
+        target_language_code (str): Target language code.
+        result_directory (Path): Target directory for translation files.
+        token_provider (IamTokenProvider): The provider of a fresh IAM token, used instead of `iam` if given.
+    Returns:
+        dict: The fetched translation data.
+    """
+
+    chunk_num = chunk["num"]
+    logger.info(f"\n{chunk_num}: Translation `{target_language_code}` ...")
+
+    translate_path = Path.joinpath(result_directory, cns.TRANSLATE_FOLDER)
+
+    # The chunk is translated by an interrupted or failed previous run
+    checkpoint_path = get_checkpoint_path(translate_path, chunk, target_language_code)
+    if (fetch_data := load_checkpoint(checkpoint_path, chunk, target_language_code)) is not None:
+        logger.info(f"{chunk_num}: Translation restored from the checkpoint.")
+        return fetch_data
+
+    # Save outgoing chunk if log level is DEBUG
+    if logger.getEffectiveLevel() == logging.DEBUG:
+        translate_path.mkdir(exist_ok=True, parents=True)
+        save_file(Path.joinpath(translate_path, f"{target_language_code} {chunk_num} chunk sent for translation.txt"), chunk["chunk"], False)
+
+    # The token may have been refreshed by another chunk
+    if token_provider is not None:
+        iam = token_provider.get_token() or iam
+
+    # Translate the chunk list
+    fetch_data = fetch_translate(iam, chunk["chunk"], target_language_code)
+
+    # The token is rejected: translate the chunk once more with a new token
+    if fetch_data.get("status_code") == 401 and token_provider is not None:
+        if (new_iam := token_provider.get_token(rejected_token=iam)) and new_iam != iam:
+            fetch_data = fetch_translate(new_iam, chunk["chunk"], target_language_code)
+
+    # Save incoming chunk if log level is DEBUG
+    if logger.getEffectiveLevel() == logging.DEBUG:
+        Path(translate_path, f"{target_language_code} {chunk_num} chunk received from the API.txt").write_text(data=f"{fetch_data}", encoding='utf-8')
+
+    if fetch_data.get("ok") and fetch_data.get("translations"):
+        save_checkpoint(checkpoint_path, chunk, target_language_code, fetch_data)
+
+    return fetch_data
+
+def merge_chunk(chunk: dict, fetch_data: dict, return_words: list, translated_words: dict = None, is_wrap_ids: bool = False) -> bool:
+    """
+    Pair the words of a chunk with their fetched translations.
+    Args:
+        chunk (dict): A chunk built by `build_chunks`.
+        fetch_data (dict): The fetched translation data of the chunk.
+        return_words (list): The list of bilingual word pairs, updated in place.
+        translated_words (dict): Caching translations for reuse, updated in place.
+        is_wrap_ids (bool): Using an ID-tagged wrapper template to ensure reversible parsing: @d+@ word @.
+    Returns:
+        bool: True if the chunk is translated.
+    """
 
-                    # Remove a translation attribute from a word in the returned list
-                    return_words[main_index] = word
+    chunk_num = chunk["num"]
+    words = chunk["chunk"]
+    extra_chunk = chunk["extra_chunk"]
+    chunk_map = chunk["chunk_map"]
 
-                    # Append the word to the chunk list
-                    if is_wrap_ids:
-                        chunk.append(wrapped_word)
-                        extra_chunk.append(word)
+    if not fetch_data["ok"]:
+        logger.warning(f"{chunk_num}: Translation failed.")
+        return False
+
+    logger.info(f"{chunk_num}: Translation complete.")
+
+    cnt = 0
+    for text in fetch_data["translations"]:
+        for item in text.values():
+
+            cnt += 1
+            if cnt > len(words):
+                logger.warning("Word count exceeded")
+                break
+
+            # ID - based pattern parsing
+            if is_wrap_ids:
+                item = re.sub(r'(@\d+?@) *(.*?) *(@)', r'\1\2\3', item)
+                for word in re.findall(r'@(\d+?)@(.*?)@', item):
+                    ind = int(word[0])
+                    if translated_words is not None:
+                        if ind not in range(1, len(words) + 1):
+                            logger.warning(f"Indeterminate word number: {ind}")
+                        else:
+                            eng_word = extra_chunk[ind - 1]
+                            translated_words[eng_word] = word[1]
                     else:
-                        chunk.append(word)
-                else:
-                    # The chunk size is too small
-                    if word_length > cns.TRANSLATE_CHUNK_SIZE:
-                        raise exc.ChunkSizeSmallError(cns.TRANSLATE_CHUNK_SIZE, word_length)
-                    break
-            main_index += 1
-
-        # Translation chunk list is ready
-        if len(chunk) > 0:
-            logger.info(f"\n{chunk_num}: Translation ...")
-
-            translate_path = Path.joinpath(result_directory, cns.TRANSLATE_FOLDER)
-
-            # Save outgoing chunk if log level is DEBUG
-            if logger.getEffectiveLevel() == logging.DEBUG:
-                if not translate_path.exists():
-                    translate_path.mkdir(exist_ok=True, parents=True)
-            if logger.getEffectiveLevel() == logging.DEBUG:
-                save_file(Path.joinpath(translate_path, f"{chunk_num} chunk sent for translation.txt"), chunk, False)
-
-            # Translate the chunk list
-            fetch_data = fetch_translate(iam, chunk, target_language_code)
-
-            # Save incoming chunk if log level is DEBUG
-            if logger.getEffectiveLevel() == logging.DEBUG:
-                Path(translate_path, f"{chunk_num} chunk received from the API.txt").write_text(data=f"{fetch_data}", encoding='utf-8')
-
-            if fetch_data["ok"]:
-                logger.info(f"{chunk_num}: Translation complete.")
-
-                cnt = 0
-                for text in fetch_data["translations"]:
-                    for item in text.values():
-
-                        cnt += 1
-                        if cnt > len(chunk):
-                            logger.warning("Word count exceeded")
-                            break
-
-                        # ID - based pattern parsing
-                        if is_wrap_ids:
-                            item = re.sub(r'(@\d+?@) *(.*?) *(@)', r'\1\2\3', item)
-                            for word in re.findall(r'@(\d+?)@(.*?)@', item):
-                                ind = int(word[0])
-                                if translated_words is not None:
-                                    if ind not in range(1, len(chunk) + 1):
-                                        logger.warning(f"Indeterminate word number: {ind}")
-                                    else:
-                                        eng_word = extra_chunk[ind - 1]
-                                        translated_words[eng_word] = word[1]
-                                else:
-                                    num = chunk_map.get(ind)
-                                    if num is not None:
-                                        # Bilingual word pair
-                                        return_words[num] = return_words[num] + " - " + word[1]
-                                        # The remaining data is logged to the error log
-                                        chunk_map.pop(ind)
-                                    else:
-                                        logger.warning(f"Indeterminate word number: {ind}")
+                        num = chunk_map.get(ind)
+                        if num is not None:
+                            # Bilingual word pair
+                            return_words[num] = return_words[num] + " - " + word[1]
+                            # The remaining data is logged to the error log
+                            chunk_map.pop(ind)
                         else:
-                            # Parsing in original word order
-                            # Cache the word
-                            if translated_words is not None:
-                                translated_words[chunk[cnt - 1]] = item
-                            else:
-                                # Bilingual word pair
-                                return_words[chunk_map[cnt]] = str(return_words[chunk_map[cnt]]) + " - " + item
-
-                if cnt == 0:
-                    logger.warning(f"{chunk_num}: Data parsing ERROR. Unable to parse translation string.")
-                elif cnt != len(chunk):
-                    logger.warning(f"{chunk_num}: The number of transmitted and translated words does not match ({cnt - len(chunk)}).")
-                    if is_wrap_ids and translated_words is None:
-                        logger.warning("Faulty word numbers: " + ",".join(f"{k}" for k in chunk_map.keys()))
-
-                # Update return_words with translate
-                if cnt > 0 and translated_words is not None:
-                    for (key, cur_list) in chunk_map.items():
-                        for ind in cur_list:
-                            return_words[int(ind)] = str(return_words[int(ind)]) + " - " + translated_words[key]
+                            logger.warning(f"Indeterminate word number: {ind}")
             else:
-                logger.warning(f"{chunk_num}: Translation failed.")
+                # Parsing in original word order
+                # Cache the word
+                if translated_words is not None:
+                    translated_words[words[cnt - 1]] = item
+                else:
+                    # Bilingual word pair
+                    return_words[chunk_map[cnt]] = str(return_words[chunk_map[cnt]]) + " - " + item
+
+    if cnt == 0:
+        logger.warning(f"{chunk_num}: Data parsing ERROR. Unable to parse translation string.")
+    elif cnt != len(words):
+        logger.warning(f"{chunk_num}: The number of transmitted and translated words does not match ({cnt - len(words)}).")
+        if is_wrap_ids and translated_words is None:
+            logger.warning("Faulty word numbers: " + ",".join(f"{k}" for k in chunk_map.keys()))
+
+    # Update return_words with translate
+    if cnt > 0 and translated_words is not None:
+        for (key, cur_list) in chunk_map.items():
+            # Words missing from the response stay untranslated
+            if (trns_word := translated_words.get(key)) is None:
+                continue
+            for ind in cur_list:
+                return_words[int(ind)] = str(return_words[int(ind)]) + " - " + trns_word
+
+    return cnt > 0
+
+def map_in_daemon_threads(func: Callable, tasks: list, max_workers: int) -> Iterator:
+    """ Apply a function to the tasks in up to `max_workers` threads and yield the results in task order.
+
+    The threads are daemon threads, so they are not joined at exit: an interrupted run stops
+    without waiting for the requests in flight. Closing the iterator stops taking new tasks.
+    """
+    futures = [Future() for _ in tasks]
+    pending = queue.SimpleQueue()
+    for task, future in zip(tasks, futures):
+        pending.put((task, future))
+    stop = threading.Event()
+
+    def work():
+        while not stop.is_set():
+            try:
+                task, future = pending.get_nowait()
+            except queue.Empty:
+                return
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(func(task))
+                except BaseException as e:
+                    future.set_exception(e)
+
+    for _ in range(max(1, min(max_workers, len(tasks)))):
+        threading.Thread(target=work, daemon=True).start()
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        stop.set()
+
+def translate_languages(iam: str, words: list, translated_words: dict, result_directory: Path, word_indices: Iterable = None,
+                        is_wrap_ids: bool = False, max_workers: int = 1, token_provider=None) -> dict:
+    """
+    Fetch translations for a list of words into several target languages through an API.
+
+    The chunks of all target languages are built first and then sent through one pool
+    with up to `max_workers` requests in flight, alternating between the languages.
+    Responses are merged in chunk order, so the result does not depend on the number of workers.
+    Every translated chunk is checkpointed in the `Translate` folder until all chunks of its language are translated,
+    so a rerun after a failure or an interruption (Ctrl+C) only sends the remaining chunks.
+    An interruption is raised again after it is logged, without waiting for the requests in flight.
+
+    Args:
+        iam (str): An IAM token is a unique sequence of characters issued to a user after authentication.
+        words (list): The list of vocabulary lines with the English words to be translated.
+        translated_words (dict): Target language code -> caching translations for reuse.
+            If None, caching is skipped for the language as input words are assumed to be unique.
+        result_directory (Path): Target directory for translation files.
+        word_indices (Iterable): Indices of the words to translate in `words`. If None, every entry is a word.
+        is_wrap_ids (bool): Using an ID-tagged wrapper template to ensure reversible parsing: @d+@ word @.
+        max_workers (int): The maximum number of translation requests in flight.
+        token_provider (IamTokenProvider): The provider of the IAM token, refreshing it on expiry or rejection.
+    Returns:
+        dict: Target language code -> the list of bilingual word pairs.
+    """
+
+    return_words = dict()
+    chunks = dict()
+    for target_language_code, cur_translated_words in translated_words.items():
+        return_words[target_language_code], chunks[target_language_code] = build_chunks(words, word_indices, cur_translated_words, is_wrap_ids)
+
+    # Chunks of the languages in turn, so that every language progresses from the start
+    tasks = list()
+    for num in range(max((len(cur_chunks) for cur_chunks in chunks.values()), default=0)):
+        tasks.extend((code, cur_chunks[num]) for code, cur_chunks in chunks.items() if num < len(cur_chunks))
+    if not tasks:
+        return return_words
+
+    translated_chunks = dict.fromkeys(chunks, 0)
+    results = map_in_daemon_threads(lambda task: fetch_chunk(iam, task[1], task[0], result_directory, token_provider),
+                                    tasks, max_workers)
+    try:
+        # The responses are yielded in task order, which is the chunk order of every language
+        for (code, chunk), fetch_data in zip(tasks, results):
+            if merge_chunk(chunk, fetch_data, return_words[code], translated_words[code], is_wrap_ids):
+                translated_chunks[code] += 1
+    except KeyboardInterrupt:
+        logger.warning(f"Translation interrupted: {sum(translated_chunks.values())} of {len(tasks)} chunks translated. "
+                       f"The next run resumes from the checkpoints.")
+        raise
+    finally:
+        # The remaining tasks are not started
+        results.close()
+
+    for code, cur_chunks in chunks.items():
+        if translated_chunks[code] == len(cur_chunks):
+            remove_checkpoints(Path.joinpath(result_directory, cns.TRANSLATE_FOLDER), code)
+        else:
+            logger.warning(f"`{code}`: {len(cur_chunks) - translated_chunks[code]} of {len(cur_chunks)} chunks are not translated. "
+                           f"The next run sends only them.")
+
+    return return_words
+
+def translate(iam: str, words: list, target_language_code: str, result_directory: Path, translated_words: dict = None,
+              word_indices: Iterable = None, is_wrap_ids: bool = False, max_workers: int = 1, token_provider=None) -> list:
+    """
+    Fetch translations for a list of words into one target language through an API.
+
+    See `translate_languages`.
+
+    Args:
+        iam (str): An IAM token is a unique sequence of characters issued to a user after authentication.
+        words (list): The list of vocabulary lines with the English words to be translated.
+        target_language_code (str): Target language code.
+        result_directory (Path): Target directory for translation files.
+        translated_words (dict): Caching translations for reuse. If None, caching is skipped as input words are assumed to be unique.
+        word_indices (Iterable): Indices of the words to translate in `words`. If None, every entry is a word.
+        is_wrap_ids (bool): Using an ID-tagged wrapper template to ensure reversible parsing: @d+@ word @.
+        max_workers (int): The maximum number of translation requests in flight.
+        token_provider (IamTokenProvider): The provider of the IAM token, refreshing it on expiry or rejection.
+    Returns:
+        list: The List of bilingual word pairs.
+    """
 
-    return return_words
\ No newline at end of file
+    return translate_languages(iam, words, {target_language_code: translated_words}, result_directory, word_indices,
+                               is_wrap_ids, max_workers, token_provider)[target_language_code]
@@ -0,0 +1,18 @@
+import os
+from src.myvocab.constants import constants as cns
+
+
+def get_uri(name: str) -> str:
+    """ Get an endpoint URI.
+
+    The variable `name` of the environment (or of the `.env` file) overrides the constant `name`,
+    e.g. to use a local stand-in server instead of Yandex Cloud.
+
+    Args:
+        name (str): Name of the URI constant, e.g. 'URI_TRANSLATE'.
+
+    Returns:
+        str: The endpoint URI.
+    """
+
+    return os.getenv(name) or getattr(cns, name)
@@ -1,55 +1,118 @@
 import requests
 import logging
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.myvocab.constants import constants as cns
 
 logger = logging.getLogger(__name__)
 
-def fetch(url: str, headers: dict, payload: dict) -> dict:
-    """ Fetch data from the given URL using the provided headers and payload. """
+# The session shared by all requests, created on the first request
+_session = None
+_session_lock = threading.Lock()
 
-    data = {}
-    try:
-        # 1. Send the POST request with a timeout (crucial for error handling)
-        response = requests.post(url=url, json=payload, headers=headers, timeout=10)
+class CappedRetry(Retry):
+    """ Retry policy that waits at most `RETRY_AFTER_MAX` seconds for the `Retry-After` header of a response. """
 
-        # 1.1. Process the successful response
-        data = response.json()
+    RETRY_AFTER_MAX: float = cns.FETCH_RETRY_AFTER_MAX
 
-        data["ok"] = response.ok
-        data["status_code"] = response.status_code
-        data["reason"] = response.reason
+    def get_retry_after(self, response) -> float | None:
+        """ Get the value of `Retry-After` in seconds, cut to `RETRY_AFTER_MAX`. """
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.RETRY_AFTER_MAX)
 
-        # 2. Raise an exception if the server returns an error code (4xx or 5xx)
-        response.raise_for_status()
+def create_session(retries: int = cns.FETCH_RETRIES, backoff_factor: float = cns.FETCH_BACKOFF_FACTOR,
+                   retry_statuses: tuple = cns.FETCH_RETRY_STATUSES, pool_size: int = cns.FETCH_POOL_SIZE) -> requests.Session:
+    """ Create a session with kept-alive connections and a retry policy.
 
-    except requests.exceptions.HTTPError as http_err:
-        logger.warning(f"HTTP error occurred: {http_err}\n{data['message']}")  # e.g., 404 Not Found or 500 Server Error
-    except requests.exceptions.ConnectionError:
-        logger.warning("Connection error: Check your internet or the server URL.")
-    except requests.exceptions.Timeout:
-        logger.warning("The request timed out.")
-    except requests.exceptions.RequestException as err:
-        logger.warning(f"An unexpected error occurred: {err}")
+    Args:
+        retries (int): Number of retries of a failed request (0 - no retries).
+        backoff_factor (float): Exponential backoff between retries in seconds: factor * 2 ** (retry - 1).
+        retry_statuses (tuple): Response status codes that are retried. `Retry-After` is respected for 429 and 503,
+            up to `CappedRetry.RETRY_AFTER_MAX` seconds.
+        pool_size (int): Maximum number of kept-alive connections per host.
 
-    return data
+    Returns:
+        Session: The configured session.
+    """
 
-def get(url: str, headers: dict) -> dict:
-    """ Get data from the given URL using the provided headers. """
+    retry = CappedRetry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=retry_statuses,
+        # The Yandex API takes every request as POST, so POST is retried too
+        allowed_methods=frozenset(("GET", "POST")),
+        respect_retry_after_header=True,
+        # The last response is returned as is when the retries are exhausted
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
-    data = {}
+def get_session() -> requests.Session:
+    """ Get the shared session, creating it on the first call. """
+
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+def set_session(session: requests.Session | None) -> None:
+    """ Replace the shared session, e.g. with another retry policy. None closes it and restores the default policy. """
+
+    global _session
+    with _session_lock:
+        if _session is not None and _session is not session:
+            _session.close()
+        _session = session
+
+def request(method: str, url: str, headers: dict, payload: dict = None, timeout: tuple | float = cns.FETCH_TIMEOUT) -> dict:
+    """ Send a request through the shared session.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Request URL.
+        headers (dict): Request headers.
+        payload (dict): JSON body of the request, if any.
+        timeout (tuple | float): Timeouts in seconds: (connect, read) or a single value for both.
+
+    Returns:
+        dict: The JSON response with the "ok", "status_code" and "reason" fields.
+            "ok" is False if no response was received or its body is not a JSON object.
+    """
+
+    data = {"ok": False}
     try:
-        # 1. Send the GET request with a timeout (crucial for error handling)
-        response = requests.get(url=url, headers=headers, timeout=10)
+        # 1. Send the request; retries and backoff are handled by the session
+        response = get_session().request(method=method, url=url, json=payload, headers=headers, timeout=timeout)
 
-        # 1.1. Process the successful response
-        data = response.json()
+        # 1.1. Process the response, an error page or a malformed body may not be a JSON object
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        is_json_object = isinstance(data, dict)
+        if not is_json_object:
+            data = {}
 
-        data["ok"] = response.ok
+        # A response without a JSON object is a failed request
+        data["ok"] = response.ok and is_json_object
         data["status_code"] = response.status_code
         data["reason"] = response.reason
 
         # 2. Raise an exception if the server returns an error code (4xx or 5xx)
         response.raise_for_status()
 
+        if not is_json_object:
+            logger.warning(f"Invalid response: the body is not a JSON object ({response.status_code} {response.reason}).")
+
     except requests.exceptions.HTTPError as http_err:
         if not (mess := data.get('message')):
             mess = data.get('errorMessage')
@@ -61,4 +124,14 @@ def get(url: str, headers: dict) -> dict:
     except requests.exceptions.RequestException as err:
         logger.warning(f"An unexpected error occurred: {err}")
 
-    return data
\ No newline at end of file
+    return data
+
+def fetch(url: str, headers: dict, payload: dict, timeout: tuple | float = cns.FETCH_TIMEOUT) -> dict:
+    """ Fetch data from the given URL using the provided headers and payload. """
+
+    return request("POST", url, headers=headers, payload=payload, timeout=timeout)
+
+def get(url: str, headers: dict, timeout: tuple | float = cns.FETCH_TIMEOUT) -> dict:
+    """ Get data from the given URL using the provided headers. """
+
+    return request("GET", url, headers=headers, timeout=timeout)
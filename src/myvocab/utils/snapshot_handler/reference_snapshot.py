@@ -0,0 +1,88 @@
+import logging
+import pickle
+from collections.abc import Callable
+from pathlib import Path
+from src.myvocab.constants import constants as cns
+
+logger = logging.getLogger(__name__)
+
+class ReferenceSnapshot:
+    """ Compiled snapshot of reference word lists.
+
+    Parsed reference lists are kept in a single binary file together with the size and
+    modification time of their text files, so all of them are loaded in one read.
+    A list is parsed again only when its text file changes.
+    """
+
+    def __init__(self, snapshot_path: Path):
+        """ Initialize the `Reference snapshot`.
+        Args:
+            snapshot_path (Path): Path to the snapshot file.
+        """
+        self.__snapshot_path = snapshot_path
+        # (parser name, resolved file path) -> ((size, mtime_ns), parsed content)
+        self.__entries = dict()
+        self.__changed = False
+        self.__load()
+
+    def __load(self) -> None:
+        """ Read the snapshot file of the previous run. """
+        if not self.__snapshot_path.is_file():
+            return
+        try:
+            with open(self.__snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+            # Snapshots of other versions are rebuilt
+            if isinstance(snapshot, dict) and snapshot.get("version") == cns.REFERENCE_SNAPSHOT_VERSION:
+                self.__entries = snapshot["entries"]
+        except Exception as e:
+            logger.warning(f"Failed to read the reference snapshot: {self.__snapshot_path}: {e}")
+
+    def get(self, file_path: Path, parser: Callable[[Path], object]) -> object:
+        """ Get the parsed content of a reference list.
+
+        Args:
+            file_path (Path): Reference list path
+            parser (Callable): Function parsing the file (e.g., `get_file_unique_lines`)
+        Returns:
+            object: Parsed content of the file.
+        """
+
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # The parser reports the missing file
+            return parser(file_path)
+
+        key = (parser.__name__, str(file_path.resolve()))
+        state = (stat.st_size, stat.st_mtime_ns)
+        if (entry := self.__entries.get(key)) is not None and entry[0] == state:
+            return entry[1]
+
+        content = parser(file_path)
+        self.__entries[key] = (state, content)
+        self.__changed = True
+        return content
+
+    def save(self) -> None:
+        """ Write the snapshot file if any reference list has been parsed again. """
+        if not self.__changed:
+            return
+
+        if not self.__snapshot_path.parent.exists():
+            self.__snapshot_path.parent.mkdir(exist_ok = True, parents = True)
+
+        snapshot = {
+            "version": cns.REFERENCE_SNAPSHOT_VERSION,
+            "entries": self.__entries
+        }
+
+        # Replace the snapshot atomically, so an interrupted run leaves the previous one intact
+        temp_file = self.__snapshot_path.with_name(self.__snapshot_path.name + ".tmp")
+        try:
+            with open(temp_file, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_file.replace(self.__snapshot_path)
+            self.__changed = False
+        except Exception as e:
+            logger.exception(f"Failed to write file: {self.__snapshot_path}: {type(e)} {e}")
@@ -0,0 +1,76 @@
+import heapq
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from src.myvocab.constants import constants as cns
+
+class ExternalSort:
+    """ External sort of unique lines.
+
+    Lines are collected in a set until it reaches the memory budget.
+    Then the set is sorted and spilled to a temporary file (a sorted run).
+    Iteration merges all sorted runs and the remaining set, skipping duplicates.
+    """
+
+    def __init__(self, temp_directory: Path, memory_budget: int = cns.SORT_MEMORY_BUDGET):
+        """ Initialize the `External sort`.
+        Args:
+            temp_directory (Path): Directory for temporary files with sorted runs.
+            memory_budget (int, optional): Maximum number of lines kept in memory. Defaults to `cns.SORT_MEMORY_BUDGET`.
+        """
+        self.__temp_directory = temp_directory
+        self.__memory_budget = max(1, memory_budget)
+        self.__lines = set()
+        self.__runs = list()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def update(self, lines: Iterable[str]) -> None:
+        """ Add lines without line breaks. """
+        for line in lines:
+            self.__lines.add(line)
+            if len(self.__lines) >= self.__memory_budget:
+                self.__spill()
+
+    def __spill(self) -> None:
+        """ Write the sorted lines to a new temporary file. """
+        if not self.__temp_directory.exists():
+            self.__temp_directory.mkdir(exist_ok = True, parents = True)
+        with tempfile.NamedTemporaryFile("w", encoding='utf-8', newline='\n', dir=self.__temp_directory,
+                                         prefix="sorted_run_", suffix=".tmp", delete=False) as file:
+            file.writelines(f"{line}\n" for line in sorted(self.__lines))
+            self.__runs.append(Path(file.name))
+        self.__lines.clear()
+
+    @staticmethod
+    def __read_run(run_path: Path) -> Iterator[str]:
+        """ Read the lines of a sorted run. """
+        with open(run_path, "r", encoding='utf-8', newline='\n') as file:
+            for line in file:
+                yield line[:-1]
+
+    def __iter__(self) -> Iterator[str]:
+        """ Iterate over the unique lines in sorted order. """
+        if not self.__runs:
+            yield from sorted(self.__lines)
+            return
+
+        runs = [self.__read_run(run_path) for run_path in self.__runs]
+        runs.append(iter(sorted(self.__lines)))
+        # k-way merge of the sorted runs
+        previous = None
+        for line in heapq.merge(*runs):
+            if line != previous:
+                yield line
+                previous = line
+
+    def close(self) -> None:
+        """ Remove the temporary files. """
+        for run_path in self.__runs:
+            run_path.unlink(missing_ok=True)
+        self.__runs.clear()
+        self.__lines.clear()
@@ -0,0 +1,47 @@
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+def scan_walk(top: Path, skip_dir: Callable[[os.DirEntry], bool] = None,
+              on_error: Callable[[OSError], None] = None) -> Iterator[tuple]:
+    """ Traverse the directory tree top-down with `os.scandir`.
+
+    Unlike `Path.walk`, excluded directories are pruned before they are listed.
+    The file type is taken from the cached `os.DirEntry` data, symbolic links to directories are not followed.
+
+    Args:
+        top (Path): The directory to start from.
+        skip_dir (Callable, optional): Returns True for a directory entry that should not be traversed.
+        on_error (Callable, optional): OS error handler.
+    Yields:
+        tuple: The directory path, the names of its included subdirectories and the names of its files.
+    """
+
+    stack = [top]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as scandir_it:
+                entries = list(scandir_it)
+        except OSError as error:
+            if on_error is not None:
+                on_error(error)
+            continue
+
+        dirnames = list()
+        filenames = list()
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if skip_dir is None or not skip_dir(entry):
+                    dirnames.append(entry.name)
+            else:
+                filenames.append(entry.name)
+
+        yield dirpath, dirnames, filenames
+
+        # Visit subdirectories in the listed order
+        stack.extend(Path.joinpath(dirpath, dirname) for dirname in reversed(dirnames))
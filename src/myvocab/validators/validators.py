@@ -3,11 +3,7 @@ from pathlib import Path
 import re
 import os
 from src.myvocab.exceptions import exceptions as exc
-from src.myvocab.authentication.auth_yandex.function_iam.fetch_iam_func import fetch_iam_func
-from src.myvocab.translation.translation_yandex.supported_languages import fetch_languages
-from src.myvocab.translation.translation_yandex.supported_languages import get_languages_list
-from src.myvocab.translation.translation_yandex.supported_languages import find_target_language_code
-from src.myvocab.parsing.commands.save_file import save_file
+from src.myvocab.translation.translation_yandex.language_catalogue import get_language_catalogue
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +36,14 @@ def validate_bool_value(reference_bools: tuple, validate_bool: str) -> None:
     if validate_bool.lower() not in reference_bools:
         raise exc.NonBooleanValueError(validate_bool)
 
+def validate_int_value(validate_int: str, min_value: int = None, name: str = None) -> None:
+    """ Validate an integer value and, if `min_value` is given, its minimum; `name` is the setting in the error. """
+
+    if not re.fullmatch(r'[+-]?[0-9]+', validate_int):
+        raise exc.NonIntegerValueError(validate_int)
+    if min_value is not None and int(validate_int) < min_value:
+        raise exc.IntegerBelowMinimumError(validate_int, min_value, name)
+
 def validate_directory_with_leading_exclamation_mark(directory_path: Path | str, use_flag: bool, message: str = None) -> None:
     """ Validate that the directory path begins with "!". """
 
@@ -59,6 +63,8 @@ def validate_directory_with_leading_exclamation_mark(directory_path: Path | str,
 def validate_target_language_code(target_language_code: str, target_languages_file: Path) -> tuple:
     """ Validate the target language.
 
+    The code is looked up without waiting for the network.
+
     Args:
         target_language_code (str): Target language code
         target_languages_file (Path): Target languages file
@@ -66,25 +72,7 @@ def validate_target_language_code(target_language_code: str, target_languages_fi
         tuple: Target language code and name.
     """
 
-    def create_target_languages_file(trg_languages_file: Path) -> None:
-        """ Create the target language file. """
-        fetch_data = fetch_iam_func()
-        if iam_token := fetch_data.get("access_token"):
-            fetch_langs = fetch_languages(iam_token)
-            if not fetch_langs["ok"]:
-                raise exc.FetchSupportedLanguagesError("")
-            langs = get_languages_list(fetch_langs)
-            save_file(file_path=trg_languages_file, items=langs, is_sorted=False)
-        else:
-            raise exc.FetchIAMtokenError("during target language validation.")
-    # Find the target language code
-    target_language = find_target_language_code(target_language_code, target_languages_file)
-    if not target_language:
-        create_target_languages_file(target_languages_file)
-        target_language = find_target_language_code(target_language_code, target_languages_file)
-        if target_language:
-            return target_language
-        else:
-            raise exc.TargetLanguageCodeIsNotFoundError(target_language_code)
+    if target_language := get_language_catalogue(target_languages_file).find(target_language_code):
+        return target_language
     else:
-        return target_language
\ No newline at end of file
+        raise exc.TargetLanguageCodeIsNotFoundError(target_language_code)
\ No newline at end of file
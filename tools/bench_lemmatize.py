@@ -0,0 +1,142 @@
+""" Equivalence check and benchmark of the word lemmatization.
+
+Generates a corpus of <<word>> files whose words repeat within and across files and reports:
+1. the cost per word token of `set_transformer` called for every token against `lemmatize_many`
+   over the distinct words, failing if any word gets a different transformation;
+2. the time of `parse_files` in one process and in a process pool, where every worker keeps
+   its own transformation cache, failing if the parsed data of any file differs.
+
+Run from the project root:
+
+    python -m tools.bench_lemmatize --words 20000 --files 40 --workers 4
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Endings that reach the singular and infinitive rules
+SUFFIXES = ("", "", "", "s", "es", "ies", "ves", "ed", "ied", "ing", "ly")
+LETTERS = "abcdefghiklmnoprstuvwyz"
+
+
+def write_corpus(base_directory: Path, words: int, files: int, tokens_per_file: int, seed: int) -> None:
+    """ Write `files` text files of <<word>> lines drawn from `words` distinct words with a skewed frequency. """
+    rnd = random.Random(seed)
+    unique = set()
+    while len(unique) < words:
+        word = "".join(rnd.choices(LETTERS, k=rnd.randint(3, 8))) + rnd.choice(SUFFIXES)
+        # Some hyphenated compounds
+        if rnd.random() < 0.05:
+            word += "-" + "".join(rnd.choices(LETTERS, k=rnd.randint(2, 6))) + rnd.choice(SUFFIXES)
+        unique.add(word)
+    unique = sorted(unique)
+    weights = [1 / (rank + 1) for rank in range(len(unique))]
+    for num in range(files):
+        tokens = rnd.choices(unique, weights=weights, k=tokens_per_file)
+        lines = (" ".join(tokens[start:start + 10]) for start in range(0, len(tokens), 10))
+        Path(base_directory, f"text_{num:03}.txt").write_text("<<word>>\n" + "\n".join(lines) + "\n<</word>>\n",
+                                                               encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the batch lemmatization against a transformation per token.")
+    parser.add_argument("--words", type=int, default=20_000, help="number of distinct words in the corpus")
+    parser.add_argument("--files", type=int, default=40, help="number of corpus files")
+    parser.add_argument("--tokens", type=int, default=5_000, help="number of word tokens per file")
+    parser.add_argument("--workers", type=int, default=4, help="number of worker processes of the pool")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The reference data of the application is written to the `Documents` of a temporary home
+        home = Path(tmp, "home")
+        Path(home, "Documents").mkdir(parents=True)
+        os.environ["HOME"] = os.environ["USERPROFILE"] = str(home)
+
+        base_directory = Path(tmp, "base")
+        base_directory.mkdir()
+        write_corpus(base_directory, args.words, args.files, args.tokens, args.seed)
+        file_paths = sorted(base_directory.glob("*.txt"))
+
+        # Imported after the environment is set: the home directory is read on import
+        from src.myvocab.constants import constants as cns
+        from src.myvocab.parsing.vocabulary import vocabulary as vcb
+        from src.myvocab.parsing.infinitive import infinitive as inf
+        from src.myvocab.parsing.commands.read_file_lines import read_file_lines
+        from src.myvocab.parsing.commands.get_tokens import get_tokens
+        from src.myvocab.parsing.commands.get_init_data import get_init_data
+        from src.myvocab.parsing.commands.get_reviewed_data import get_reviewed_data
+        from src.myvocab.parsing.commands.set_transformer import set_transformer
+        from src.myvocab.parsing.commands.lemmatize_many import lemmatize_many
+        from src.myvocab.parsing.commands.parse_files import parse_files
+
+        # The transformers as `render_vocab` sets them
+        vocab = vcb.VocabConfig(base_directory)
+        vocab.set_singular()
+        vocab.singular.load_lists()
+        vocab.set_infinitive()
+        vocab.infinit.load_lists()
+        vocab.verbs_ending_s = set(inf.InfinitAttrib.infinit_attrib_verbs_ending_s()) | set(vocab.infinit.verbs_ending_s())
+
+        def transform_token(word: str, parts: tuple) -> dict:
+            """ Process a word token on its own, as `parse_file` did before the batch. """
+            if parts and (transform_data := get_reviewed_data(word, vocab)) is None:
+                phrase = "-".join(set_transformer(part, vocab)["word"] for part in parts)
+                transform_data = get_init_data(phrase)
+                if phrase != word:
+                    transform_data["pair"] = word + " - " + phrase
+                return transform_data
+            return set_transformer(word, vocab)
+
+        failed = False
+
+        # 1. Cost per word token
+        tokens = [token for path in file_paths for line in read_file_lines(path)
+                  if line not in (cns.TAG_WORD, cns.TAG_END_WORD)
+                  for token in get_tokens(line) if token[0] != cns.TOKEN_NUMBER]
+        distinct = list(dict.fromkeys(word for token_type, word, parts in tokens))
+
+        start = time.perf_counter()
+        expected = {word: transform_token(word, parts) for token_type, word, parts in tokens}
+        token_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = lemmatize_many(distinct, vocab)
+        batch_seconds = time.perf_counter() - start
+
+        diffs = [word for word in distinct if expected[word] != actual[word]]
+        print(f"tokens {len(tokens)}, distinct words {len(distinct)}")
+        print(f"{'per token':<12} {token_seconds / len(tokens) * 1e6:>8.2f} us/token")
+        print(f"{'batch':<12} {batch_seconds / len(tokens) * 1e6:>8.2f} us/token "
+              f"({token_seconds / batch_seconds:.1f}x), diffs {len(diffs)}")
+        for word in diffs[:20]:
+            print(f"  {word!r}: per token {expected[word]} != batch {actual[word]}")
+        failed = failed or bool(diffs)
+
+        # 2. Parsing the files in one process and in the pool
+        results = dict()
+        for workers in dict.fromkeys((1, args.workers)):
+            vocab.parse_workers = workers
+            start = time.perf_counter()
+            results[workers] = list(parse_files(vocab, file_paths, dict()))
+            print(f"parse_files, {workers} worker(s): {(time.perf_counter() - start) * 1000:>8.0f} ms")
+        file_diffs = [path.name for path, serial, pooled in zip(file_paths, results[1], results[args.workers])
+                      if serial != pooled]
+        print(f"files with different parsed data: {len(file_diffs)}")
+        for name in file_diffs[:20]:
+            print(f"  {name}")
+        failed = failed or bool(file_diffs)
+
+    if failed:
+        sys.exit(1)
+    print("OK: the batch lemmatization gives the same transformations as a transformation per token.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+""" Equivalence check and benchmark of the <<word>> tokenizer.
+
+Runs the loop that `parse_file` used before `get_tokens` (a `re.findall` per line, then a `re.match`
+and a `re.split` per word) and `get_tokens` over a generated corpus of <<word>> lines,
+fails on any difference and reports the throughput of both.
+
+Run from the project root:
+
+    python -m tools.bench_tokens --lines 50000
+"""
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.myvocab.constants import constants as cns
+from src.myvocab.parsing.commands.get_tokens import get_tokens
+
+# Tokens and separators that reach every branch of the classification
+SEPARATORS = (" ", " ", " ", ", ", ". ", "; ", " - ", "\t", " (", ") ", "'", "\"", " — ", "/")
+SPECIAL_TOKENS = ("-", "--", "-abc", "abc-", "a--b", "12-abc", "abc-12", "1980s", "1980", "0", "x-ray", "passers-by",
+                  "strong-willed", "Über", "café", "naïve", "_under_", "it's", "ABC", "e-mail", "3-d", "-1-")
+
+
+def baseline_tokens(line: str) -> list:
+    """ Classify the tokens of a line with the loop of `parse_file` before `get_tokens`. """
+    tokens = list()
+    for word in re.findall(r'\b[a-zA-Z0-9-]+\b', line.lower()):
+        # Numbers
+        if re.match(r'\b[0-9]+\b', word):
+            tokens.append((cns.TOKEN_NUMBER, word, ()))
+            continue
+        # If the word contains a hyphen
+        is_multi = False
+        multi_words = re.split(r'-', word)
+        if len(multi_words) > 1:
+            for m_word in multi_words:
+                if m_word != "":
+                    is_multi = True
+                    break
+        if is_multi:
+            tokens.append((cns.TOKEN_COMPOUND, word, tuple(m_word for m_word in multi_words if m_word != "")))
+        else:
+            tokens.append((cns.TOKEN_WORD, word, ()))
+    return tokens
+
+
+def generate_lines(count: int, words_per_line: int, seed: int) -> list:
+    """ Generate <<word>> lines of random words, numbers, hyphenated compounds and punctuation. """
+    rnd = random.Random(seed)
+    letters = string.ascii_letters + string.digits + "-"
+    lines = list()
+    for _ in range(count):
+        parts = list()
+        for _ in range(rnd.randint(1, 2 * words_per_line)):
+            if rnd.random() < 0.1:
+                parts.append(rnd.choice(SPECIAL_TOKENS))
+            else:
+                parts.append("".join(rnd.choices(letters, k=rnd.randint(1, 10))))
+            parts.append(rnd.choice(SEPARATORS))
+        lines.append("".join(parts))
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that get_tokens classifies the tokens as the loop it replaced.")
+    parser.add_argument("--lines", type=int, default=50_000, help="number of generated lines")
+    parser.add_argument("--words-per-line", type=int, default=10, help="average number of tokens per line")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    lines = generate_lines(args.lines, args.words_per_line, args.seed)
+
+    start = time.perf_counter()
+    expected = [baseline_tokens(line) for line in lines]
+    baseline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [get_tokens(line) for line in lines]
+    tokens_seconds = time.perf_counter() - start
+
+    diffs = [(line, old, new) for line, old, new in zip(lines, expected, actual) if old != new]
+    print(f"{'lines':>8} {'tokens':>9} {'diffs':>6} {'baseline ms':>12} {'get_tokens ms':>14} {'speedup':>8}")
+    print(f"{len(lines):>8} {sum(map(len, expected)):>9} {len(diffs):>6} {baseline_seconds * 1000:>12.0f} "
+          f"{tokens_seconds * 1000:>14.0f} {baseline_seconds / tokens_seconds:>7.1f}x")
+    for line, old, new in diffs[:20]:
+        print(f"  {line!r}:\n    baseline   {old}\n    get_tokens {new}")
+
+    if diffs:
+        sys.exit(1)
+    print("OK: get_tokens gives the same tokens as the loop it replaced.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+""" Translation benchmark against the local stand-in Yandex server.
+
+Generates a corpus of English words in a temporary base directory, runs `render_vocab` with translation
+enabled against `tools.fake_yandex_server` and reports chunks per second and words per second
+for every number of translation workers.
+
+Run from the project root:
+
+    python -m tools.bench_translate --words 20000 --latency 0.2 --workers 1,4,8
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.fake_yandex_server import FakeYandexServer
+
+
+def write_corpus(base_directory: Path, words: int, files: int, seed: int) -> None:
+    """ Write `files` text files with `words` unique random words in total. """
+    rnd = random.Random(seed)
+    unique = set()
+    while len(unique) < words:
+        unique.add("".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(4, 10))))
+    unique = sorted(unique)
+    rnd.shuffle(unique)
+    per_file = -(-words // files)
+    for num in range(files):
+        part = unique[num * per_file:(num + 1) * per_file]
+        Path(base_directory, f"text_{num:03}.txt").write_text("<<word>>\n" + "\n".join(part) + "\n", encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the translation of render_vocab against a local stand-in server.")
+    parser.add_argument("--words", type=int, default=20_000, help="number of unique words in the corpus")
+    parser.add_argument("--files", type=int, default=20, help="number of corpus files")
+    parser.add_argument("--workers", default="1,4,8", help="comma-separated values of `translate_workers`")
+    parser.add_argument("--latency", type=float, default=0.2, help="delay of every server response in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with a transient error")
+    parser.add_argument("--retry-after", type=int, default=None, help="answer transient errors with 429 and this Retry-After")
+    parser.add_argument("--char-limit", type=int, default=10_000, help="maximum characters per translation request")
+    parser.add_argument("--unordered", action="store_true", help="set `use_order_text = False`")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            FakeYandexServer(latency=args.latency, error_rate=args.error_rate, char_limit=args.char_limit,
+                             retry_after=args.retry_after, seed=args.seed) as server:
+        # The reference data of the application is written to the `Documents` of a temporary home
+        home = Path(tmp, "home")
+        Path(home, "Documents").mkdir(parents=True)
+        os.environ["HOME"] = os.environ["USERPROFILE"] = str(home)
+        os.environ["AUTH"] = "function_iam"
+        os.environ.update(server.uris)
+
+        base_directory = Path(tmp, "base")
+        base_directory.mkdir()
+        write_corpus(base_directory, args.words, args.files, args.seed)
+
+        # Imported after the environment is set: the home directory is read on import
+        from src.myvocab.parsing.vocabulary import vocabulary as vcb
+        from src.myvocab.processing import processor as prc
+        settings_file = vcb.VocabConfig(base_directory).settings_file
+
+        print(f"words={args.words} files={args.files} latency={args.latency}s error_rate={args.error_rate} "
+              f"char_limit={args.char_limit} use_order_text={not args.unordered}")
+        print(f"{'workers':>7} {'seconds':>8} {'chunks':>6} {'chunks/s':>9} {'words':>7} {'words/s':>9} {'errors':>6}")
+        for workers in (int(item) for item in args.workers.split(",")):
+            settings_file.parent.mkdir(parents=True, exist_ok=True)
+            settings_file.write_text(
+                "use_word_translate = True\n"
+                "use_translation_cache = False\n"
+                f"use_order_text = {not args.unordered}\n"
+                f"translate_workers = {workers}\n",
+                encoding="utf-8")
+
+            server.reset_stats()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                prc.render_vocab(base_directory)
+            seconds = time.perf_counter() - start
+
+            stats = dict(server.stats)
+            print(f"{workers:>7} {seconds:>8.2f} {stats['translate_requests']:>6} "
+                  f"{stats['translate_requests'] / seconds:>9.1f} {stats['texts']:>7} "
+                  f"{stats['texts'] / seconds:>9.0f} {stats['errors']:>6}")
+
+
+if __name__ == "__main__":
+    main()
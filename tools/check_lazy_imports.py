@@ -0,0 +1,91 @@
+""" Check that a run without translation never imports the translation and authentication stack.
+
+Imports the `myvocab.py` entry point and runs `render_vocab` with `use_word_translate = False`
+on a generated corpus in a temporary base directory, then fails if any network module is loaded.
+
+Run from the project root:
+
+    python -m tools.check_lazy_imports
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.bench_translate import write_corpus
+
+# Modules that must be imported only when translation is enabled
+FORBIDDEN_MODULES = (
+    "requests",
+    "urllib3",
+    "src.myvocab.utils.fetche_handler.fetcher",
+    "src.myvocab.translation.translator",
+    "src.myvocab.translation.translation_yandex.fetch_translate",
+    "src.myvocab.translation.translation_yandex.supported_languages",
+    "src.myvocab.authentication.auth_yandex.function_iam.fetch_iam_func",
+    "src.myvocab.authentication.auth_yandex.account_iam.fetch_iam_oauth",
+    "src.myvocab.authentication.auth_yandex.exchange_jwt_iam.create_iam_token",
+)
+
+
+def get_loaded(modules: tuple) -> list:
+    """ Get the modules of the list that are imported. """
+    return [name for name in modules if name in sys.modules]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that a run without translation does not import the network stack.")
+    parser.add_argument("--words", type=int, default=2_000, help="number of unique words in the corpus")
+    parser.add_argument("--files", type=int, default=5, help="number of corpus files")
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        # The reference data of the application is written to the `Documents` of a temporary home
+        home = Path(tmp, "home")
+        Path(home, "Documents").mkdir(parents=True)
+        os.environ["HOME"] = os.environ["USERPROFILE"] = str(home)
+
+        base_directory = Path(tmp, "base")
+        base_directory.mkdir()
+        write_corpus(base_directory, args.words, args.files, seed=1)
+
+        # 1. The entry point
+        start = time.perf_counter()
+        import myvocab  # noqa: F401
+        print(f"import myvocab: {(time.perf_counter() - start) * 1000:.0f} ms")
+        if loaded := get_loaded(FORBIDDEN_MODULES):
+            print(f"FAIL: imported by `import myvocab`: {', '.join(loaded)}")
+            failed = True
+
+        # 2. Runs without translation; the supported languages file is missing, so it is stale.
+        # The first run writes the default settings, the second one loads them with `target_language_code`
+        from src.myvocab.processing import processor as prc
+        for run in range(2):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                prc.render_vocab(base_directory)
+            print(f"render_vocab without translation, run {run + 1}: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        # Background threads would import the network stack lazily
+        for thread in threading.enumerate():
+            if thread is not threading.current_thread():
+                thread.join(timeout=5)
+        if loaded := get_loaded(FORBIDDEN_MODULES):
+            print(f"FAIL: imported by a run without translation: {', '.join(loaded)}")
+            failed = True
+
+    if failed:
+        sys.exit(1)
+    print("OK: the translation and authentication stack is not imported.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+""" Equivalence check and benchmark of the singular rules.
+
+Runs the suffix dispatch (`_dispatch_singular`) and the regular expression cascade (`_match_singular`)
+of `get_singular` over the words of the shipped `singularization/data/reviewed_pairs.txt`,
+the inflected words of the reference lists and a generated word list, fails on any difference and reports the throughput of both paths.
+
+Run from the project root:
+
+    python -m tools.check_singular_equivalence --words 200000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Letters, digits and endings that reach every rule of the cascade
+ALPHABET = "aeiouybcdfhkprstvxz019"
+SUFFIXES = ("s", "es", "ves", "fes", "oes", "os", "ies", "ys", "ses", "sses", "xes", "zes", "ches", "shes",
+            "1s", "9s", "ss", "e", "ed", "")
+# Words ending in -f and in a consonant, added to `singular_ending_non_s` to reach rules 60 and 100:
+# the shipped list has none of them. Rules 80, 120 and 150 are shadowed by rules 30 and 40 in both paths
+EXTRA_SINGULAR_ENDING_NON_S = ("calf", "hoof", "wharf", "sk", "fl")
+
+
+def read_pair_words(pairs_file: Path) -> list:
+    """ Read both words of every `word - base form` line. """
+    words = list()
+    for line in pairs_file.read_text(encoding="utf-8").splitlines():
+        words.extend(word.strip() for word in line.split(" - ") if word.strip())
+    return words
+
+
+def inflect_words(bases, suffixes: tuple) -> list:
+    """ Append every ending to the base words and to their stems without the last one or two letters. """
+    return [stem + suffix for base in bases for stem in {base, base[:-1], base[:-2]} for suffix in suffixes]
+
+
+def generate_words(count: int, seed: int) -> list:
+    """ Generate random words with the endings of the rules. """
+    rnd = random.Random(seed)
+    return ["".join(rnd.choices(ALPHABET, k=rnd.randint(0, 6))) + rnd.choice(SUFFIXES) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the suffix dispatch of get_singular matches the regex cascade.")
+    parser.add_argument("--words", type=int, default=200_000, help="number of generated words")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The reference data of the application is written to the `Documents` of a temporary home
+        home = Path(tmp, "home")
+        Path(home, "Documents").mkdir(parents=True)
+        os.environ["HOME"] = os.environ["USERPROFILE"] = str(home)
+
+        # Imported after the environment is set: the home directory is read on import
+        from src.myvocab.parsing.vocabulary import vocabulary as vcb
+        from src.myvocab.parsing.singularization.data import path_file
+        from src.myvocab.parsing.commands.get_singular import _dispatch_singular, _match_singular
+
+        vocab = vcb.VocabConfig(Path(tmp))
+        vocab.set_singular()
+        vocab.singular.load_lists()
+        attrib = vocab.singular
+        attrib.singular_ending_non_s.update(EXTRA_SINGULAR_ENDING_NON_S)
+
+        reviewed_words = read_pair_words(Path(path_file.__file__).parent / "reviewed_pairs.txt")
+        # The suffix dispatch is used only for alphanumeric words, as in `get_singular`
+        word_lists = {
+            "reviewed_pairs.txt": [word.lower() for word in reviewed_words],
+            # The rules with exceptions are reached only by the words of the reference lists
+            "reference lists": inflect_words(
+                attrib.only_ending_s | attrib.singular_ending_non_s
+                | set(attrib.irregular_plural_nouns) | set(attrib.irregular_plural_nouns.values()),
+                SUFFIXES),
+            "generated": generate_words(args.words, args.seed),
+        }
+
+        failed = False
+        print(f"{'words':<18} {'count':>8} {'diffs':>6} {'cascade w/s':>12} {'dispatch w/s':>13} {'speedup':>8}")
+        for name, words in word_lists.items():
+            words = [word for word in words if word.isascii() and word.isalnum()]
+
+            start = time.perf_counter()
+            expected = [_match_singular(word, attrib) for word in words]
+            match_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            actual = [_dispatch_singular(word, attrib) for word in words]
+            dispatch_seconds = time.perf_counter() - start
+
+            diffs = [(word, old, new) for word, old, new in zip(words, expected, actual) if old != new]
+            print(f"{name:<18} {len(words):>8} {len(diffs):>6} {len(words) / match_seconds:>12.0f} "
+                  f"{len(words) / dispatch_seconds:>13.0f} {match_seconds / dispatch_seconds:>7.1f}x")
+            for word, old, new in diffs[:20]:
+                print(f"  {word!r}: cascade {old} != dispatch {new}")
+            failed = failed or bool(diffs)
+
+    if failed:
+        sys.exit(1)
+    print("OK: the suffix dispatch gives the same results as the regular expression cascade.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+""" Local stand-in for the Yandex Cloud endpoints used by myvocab.
+
+Serves the translation, supported languages and IAM token endpoints with configurable latency,
+error rate and character limit per translation request. A text is "translated" by upper-casing it,
+so the ID-tagged wrapper template (@1@ word @) survives the translation.
+
+Start the server from the project root:
+
+    python -m tools.fake_yandex_server --port 8765 --latency 0.2
+
+and point the application at it in the `.env` file (the printed lines).
+"""
+import argparse
+import json
+import logging
+import random
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+PATH_TRANSLATE = "/translate/v2/translate"
+PATH_LANGUAGES = "/translate/v2/languages"
+PATH_IAM_TOKENS = "/iam/v1/tokens"
+PATH_FUNC_IAM_TOKENS = "/function/iam"
+
+LANGUAGES = [
+    {"code": "en", "name": "English"},
+    {"code": "ru", "name": "русский"},
+    {"code": "de", "name": "Deutsch"},
+    {"code": "fr", "name": "Français"},
+    {"code": "es", "name": "español"},
+]
+
+
+class FakeYandexServer:
+    """ Local stand-in for the Yandex Cloud endpoints. """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, error_rate: float = 0.0,
+                 char_limit: int = 10_000, retry_after: int | None = None, seed: int | None = None):
+        """
+        Args:
+            host (str): Host to listen on.
+            port (int): Port to listen on (0 - any free port).
+            latency (float): Delay of every response in seconds.
+            error_rate (float): Share of requests answered with a transient error (0.0 - 1.0).
+            char_limit (int): Maximum number of characters of the texts of a translation request.
+            retry_after (int | None): Transient errors are 429 with this `Retry-After`, otherwise 503.
+            seed (int | None): Seed of the error generator for reproducible runs.
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.char_limit = char_limit
+        self.retry_after = retry_after
+        self.token = secrets.token_hex(16)
+        self.stats = {"requests": 0, "token_requests": 0, "translate_requests": 0, "texts": 0, "chars": 0, "errors": 0}
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__thread = None
+        self.__httpd = ThreadingHTTPServer((host, port), self.__make_handler())
+        self.__httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """ Get the base URL of the server. """
+        host, port = self.__httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def uris(self) -> dict:
+        """ Get the endpoint URIs by the names of their constants, e.g. for the `.env` file. """
+        return {
+            "URI_FUNC_IAM_TOKENS": self.url + PATH_FUNC_IAM_TOKENS,
+            "URI_IAM_TOKENS": self.url + PATH_IAM_TOKENS,
+            "URI_TRANSLATE": self.url + PATH_TRANSLATE,
+            "URI_LANGUAGES": self.url + PATH_LANGUAGES,
+        }
+
+    def start(self) -> "FakeYandexServer":
+        """ Serve requests in a background thread. """
+        self.__thread = threading.Thread(target=self.__httpd.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        """ Stop serving and close the socket. """
+        self.__httpd.shutdown()
+        self.__httpd.server_close()
+
+    def reset_stats(self) -> None:
+        """ Zero the request counters. """
+        with self.__lock:
+            for key in self.stats:
+                self.stats[key] = 0
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def handle(self, method: str, path: str, headers, body: dict) -> tuple:
+        """ Answer a request.
+
+        Returns:
+            tuple: Status code, JSON body and extra headers.
+        """
+        with self.__lock:
+            self.stats["requests"] += 1
+            is_error = self.__random.random() < self.error_rate
+            if is_error:
+                self.stats["errors"] += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if is_error:
+            if self.retry_after is not None:
+                return 429, {"code": 8, "message": "Too many requests"}, {"Retry-After": str(self.retry_after)}
+            return 503, {"code": 14, "message": "Service unavailable"}, {}
+
+        if path in (PATH_FUNC_IAM_TOKENS, PATH_IAM_TOKENS):
+            with self.__lock:
+                self.stats["token_requests"] += 1
+
+        if path == PATH_FUNC_IAM_TOKENS and method == "GET":
+            return 200, {"access_token": self.token, "expires_in": 43200, "token_type": "Bearer"}, {}
+
+        if path == PATH_IAM_TOKENS and method == "POST":
+            if not body.get("yandexPassportOauthToken"):
+                return 400, {"code": 3, "message": "yandexPassportOauthToken is required"}, {}
+            expires_at = datetime.now(timezone.utc) + timedelta(hours=12)
+            return 200, {"iamToken": self.token, "expiresAt": expires_at.isoformat().replace("+00:00", "Z")}, {}
+
+        if path not in (PATH_TRANSLATE, PATH_LANGUAGES) or method != "POST":
+            return 404, {"code": 5, "message": f"Not found: {method} {path}"}, {}
+
+        if headers.get("Authorization") != f"Bearer {self.token}":
+            return 401, {"code": 16, "message": "The token is invalid"}, {}
+
+        if path == PATH_LANGUAGES:
+            return 200, {"languages": LANGUAGES}, {}
+
+        texts = body.get("texts") or []
+        chars = sum(len(text) for text in texts)
+        if chars > self.char_limit:
+            return 400, {"code": 3, "message": f"limit on input text length exceeded: {chars} > {self.char_limit}"}, {}
+        if body.get("targetLanguageCode") not in {item["code"] for item in LANGUAGES}:
+            return 400, {"code": 3, "message": f"unsupported target language: {body.get('targetLanguageCode')}"}, {}
+
+        with self.__lock:
+            self.stats["translate_requests"] += 1
+            self.stats["texts"] += len(texts)
+            self.stats["chars"] += chars
+        # `detectedLanguageCode` is returned only without `sourceLanguageCode`
+        translations = [{"text": text.upper()} for text in texts]
+        if not body.get("sourceLanguageCode"):
+            for translation in translations:
+                translation["detectedLanguageCode"] = "en"
+        return 200, {"translations": translations}, {}
+
+    def __make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive connections like the real endpoints
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                logger.debug(format, *args)
+
+            def __answer(self, method: str):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    body = None
+                if not isinstance(body, dict):
+                    status, data, extra = 400, {"code": 3, "message": "The body is not a JSON object"}, {}
+                else:
+                    status, data, extra = server.handle(method, self.path, self.headers, body)
+                payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in extra.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self.__answer("GET")
+
+            def do_POST(self):
+                self.__answer("POST")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Yandex Cloud endpoints used by myvocab.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="delay of every response in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with a transient error")
+    parser.add_argument("--char-limit", type=int, default=10_000, help="maximum characters per translation request")
+    parser.add_argument("--retry-after", type=int, default=None, help="answer transient errors with 429 and this Retry-After")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = FakeYandexServer(args.host, args.port, args.latency, args.error_rate, args.char_limit, args.retry_after, args.seed)
+    print("Add to the `.env` file:")
+    print("AUTH=function_iam")
+    for name, uri in server.uris.items():
+        print(f"{name}={uri}")
+    print("Press Ctrl+C to stop.")
+    try:
+        server.start()
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"\n{server.stats}")
+
+
+if __name__ == "__main__":
+    main()